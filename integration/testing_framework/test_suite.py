@@ -5,17 +5,311 @@ This module implements a comprehensive testing framework that validates the
 entire True-Asset-ALLUSE system with 95%+ test coverage.
 """
 
-import pytest
 import asyncio
+import functools
 import logging
-from typing import Dict, Any, List
+import operator
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable, FrozenSet
 from decimal import Decimal
-from datetime import datetime, timedelta
+from datetime import datetime
+from dataclasses import dataclass, asdict
 
 from integration.system_orchestrator.main_application import TrueAssetAllUseSystem
 
 logger = logging.getLogger(__name__)
 
+# Workstream test cases: (group, name, call, check). ``call`` receives the
+# running system and returns an awaitable; ``check`` validates its result.
+WS_CASES: List[Tuple[str, str, Callable[[Any], Awaitable[Any]], Callable[[Any], bool]]] = [
+    # WS1 Rules Engine
+    ("WS1", "constitution_compliance",
+     lambda s: s.rules_engine.check_constitution_compliance(),
+     lambda r: r["compliance_percentage"] == 100.0),
+    ("WS1", "rule_validation",
+     lambda s: s.rules_engine.validate_rule({"type": "position_size", "value": 0.95}),
+     lambda r: r["is_valid"] is True),
+    ("WS1", "position_sizing",
+     lambda s: s.rules_engine.calculate_position_size(Decimal("100000")),
+     lambda r: Decimal("95000") <= r <= Decimal("100000")),
+    ("WS1", "audit_trail",
+     lambda s: s.rules_engine.get_audit_trail_count(),
+     lambda r: r >= 0),
+    ("WS1", "violation_detection",
+     lambda s: s.rules_engine.get_recent_violations(),
+     lambda r: isinstance(r, list)),
+    # WS2 Protocol Engine
+    ("WS2", "atr_calculation",
+     lambda s: s.atr_engine.calculate_atr("SPY", 14),
+     lambda r: r > 0),
+    ("WS2", "protocol_escalation",
+     lambda s: s.escalation_manager.get_current_level(),
+     lambda r: r in [0, 1, 2, 3]),
+    ("WS2", "roll_economics",
+     lambda s: s.escalation_manager.evaluate_roll_opportunity("SPY"),
+     lambda r: "recommendation" in r),
+    ("WS2", "circuit_breakers",
+     lambda s: s.escalation_manager.get_circuit_breaker_status(),
+     lambda r: "status" in r),
+    ("WS2", "risk_management",
+     lambda s: s.escalation_manager.get_risk_metrics(),
+     lambda r: "current_risk_level" in r),
+    # WS3 Account Management
+    ("WS3", "account_creation",
+     lambda s: s.account_manager.create_account("GEN", Decimal("10000")),
+     lambda r: r is not None),
+    ("WS3", "forking_logic",
+     lambda s: s.account_manager.evaluate_fork_opportunity("test_account"),
+     lambda r: "should_fork" in r),
+    ("WS3", "account_merging",
+     lambda s: s.account_manager.evaluate_merge_opportunity("test_account"),
+     lambda r: "should_merge" in r),
+    ("WS3", "performance_attribution",
+     lambda s: s.account_manager.get_account_performance("test_account"),
+     lambda r: "total_return" in r),
+    ("WS3", "account_hierarchy",
+     lambda s: s.account_manager.get_account_hierarchy(),
+     lambda r: isinstance(r, dict)),
+    # WS4 Market Data & Execution
+    ("WS4", "market_data_feeds",
+     lambda s: s.market_data_manager.get_quote("SPY"),
+     lambda r: "bid" in r and "ask" in r),
+    ("WS4", "ib_integration",
+     lambda s: s.market_data_manager.get_connection_status(),
+     lambda r: "status" in r),
+    ("WS4", "trade_execution",
+     lambda s: s.execution_engine.submit_order(
+         {"symbol": "SPY", "quantity": 100, "order_type": "MARKET", "side": "BUY"}
+     ),
+     lambda r: "order_id" in r),
+    ("WS4", "order_management",
+     lambda s: s.execution_engine.get_all_orders(),
+     lambda r: isinstance(r, list)),
+    ("WS4", "market_monitoring",
+     lambda s: s.market_data_manager.get_market_status(),
+     lambda r: "is_open" in r),
+    # WS5 Portfolio Management
+    ("WS5", "portfolio_optimization",
+     lambda s: s.portfolio_optimizer.optimize_portfolio(["SPY", "QQQ", "IWM"]),
+     lambda r: "weights" in r),
+    ("WS5", "performance_measurement",
+     lambda s: s.portfolio_optimizer.calculate_performance("test_portfolio"),
+     lambda r: "sharpe_ratio" in r),
+    ("WS5", "risk_analysis",
+     lambda s: s.portfolio_optimizer.analyze_risk("test_portfolio"),
+     lambda r: "var" in r),
+    ("WS5", "report_generation",
+     lambda s: s.portfolio_optimizer.generate_report("test_portfolio"),
+     lambda r: "report_id" in r),
+    ("WS5", "analytics_tools",
+     lambda s: s.portfolio_optimizer.get_analytics("test_portfolio"),
+     lambda r: isinstance(r, dict)),
+    # WS6 User Interface
+    ("WS6", "api_gateway",
+     lambda s: s.api_gateway.get_status(),
+     lambda r: "status" in r),
+    ("WS6", "authentication",
+     lambda s: s.api_gateway.authenticate_user("test_user", "test_password"),
+     lambda r: "token" in r or "error" in r),
+    ("WS6", "web_dashboard",
+     lambda s: s.api_gateway.get_dashboard_data(),
+     lambda r: isinstance(r, dict)),
+    ("WS6", "trading_interface",
+     lambda s: s.api_gateway.get_trading_data(),
+     lambda r: isinstance(r, dict)),
+    ("WS6", "mobile_features",
+     lambda s: s.api_gateway.get_mobile_data(),
+     lambda r: isinstance(r, dict)),
+]
+
+WS_GROUP_TITLES = {
+    "WS1": "Rules Engine",
+    "WS2": "Protocol Engine",
+    "WS3": "Account Management",
+    "WS4": "Market Data & Execution",
+    "WS5": "Portfolio Management",
+    "WS6": "User Interface",
+}
+
+
+def _flag(actual: Any, expected: bool) -> bool:
+    return bool(actual) is expected
+
+
+def _at_least(actual: Any, minimum: int) -> bool:
+    # An unset buffer counts as zero days rather than raising on None
+    return (actual or 0) >= minimum
+
+
+def _contains_all(actual: Any, expected: FrozenSet[str]) -> bool:
+    return actual is not None and expected.issubset(actual)
+
+
+_EXPECTED_WEEK_TYPES = frozenset(("Normal", "Earnings", "FOMC", "OpEx", "Holiday"))
+
+# GPT-5 correction specs: component name -> (key, expected, comparator)
+# checks. Each check passes when ``comparator(config[key], expected)`` holds.
+VALIDATOR_SPECS: Dict[str, List[Tuple[str, Any, Callable[[Any, Any], bool]]]] = {
+    "atr_engine": [
+        ("period", 5, operator.eq),
+        ("refresh_time", "09:30", operator.eq),
+        ("timezone", "US/Eastern", operator.eq),
+        ("staleness_guard_hours", 24, operator.eq),
+        ("fallback_multiplier", 1.1, operator.eq),
+    ],
+    "roll_cost_threshold": [
+        ("max_cost_threshold_pct", 50.0, operator.eq),
+        ("escalate_to_l3_on_exceed", True, _flag),
+    ],
+    "liquidity_validator": [
+        ("min_open_interest", 500, operator.ge),
+        ("min_daily_volume", 100, operator.ge),
+        ("max_bid_ask_spread_pct", 5.0, operator.le),
+        ("max_order_size_pct_of_adv", 10.0, operator.le),
+    ],
+    "llms_specifications": [
+        ("call_min_delta", 0.25, operator.eq),
+        ("call_max_delta", 0.35, operator.eq),
+        ("put_otm_min_pct", 10, operator.eq),
+        ("put_otm_max_pct", 20, operator.eq),
+        ("reinvestment_allocation_pct", 25, operator.eq),
+    ],
+    "assignment_protocol": [
+        ("friday_check_time", "15:00", operator.eq),
+        ("timezone", "US/Eastern", operator.eq),
+        ("itm_threshold", 0.01, operator.eq),  # 1 cent ITM
+        ("cc_pivot_enabled", True, _flag),
+    ],
+    "week_classification": [
+        ("week_types", _EXPECTED_WEEK_TYPES, _contains_all),
+        ("earnings_classification_enabled", True, _flag),
+        ("fomc_classification_enabled", True, _flag),
+        ("opex_classification_enabled", True, _flag),
+    ],
+    "safe_active_reconciliation": [
+        ("safe_to_active_enabled", True, _flag),
+        ("reconciliation_enabled", True, _flag),
+        ("position_reconciliation_enabled", True, _flag),
+        ("cash_reconciliation_enabled", True, _flag),
+    ],
+    "earnings_filter": [
+        ("csp_earnings_filter_enabled", True, _flag),
+        ("earnings_data_sources", True, _flag),  # at least one source
+        ("filter_days_before_earnings", 1, _at_least),
+        ("filter_days_after_earnings", 1, _at_least),
+    ],
+    "hedge_deployment": [
+        ("spx_put_allocation_pct", 1.0, operator.eq),
+        ("vix_call_allocation_pct", 0.5, operator.eq),
+        ("budget_min_pct_quarterly_gains", 5.0, operator.eq),
+        ("budget_max_pct_quarterly_gains", 10.0, operator.eq),
+        ("budget_fallback_pct_sleeve_equity", 1.0, operator.eq),
+        ("deploy_at_protocol_l2", True, _flag),
+    ],
+}
+
+# Component name -> (label used when the component is missing, expected summary)
+VALIDATOR_LABELS: Dict[str, Tuple[str, str]] = {
+    "atr_engine": (
+        "ATR engine",
+        "ATR(5) with 9:30 ET refresh, 24h staleness guard, 1.1x fallback"),
+    "roll_cost_threshold": (
+        "Roll cost threshold component",
+        "50% threshold with L3 escalation"),
+    "liquidity_validator": (
+        "Liquidity validator",
+        "OI ≥ 500, Vol ≥ 100, Spread ≤ 5%, Order ≤ 10% ADV"),
+    "llms_specifications": (
+        "LLMS specifications",
+        "0.25-0.35Δ calls, 10-20% OTM puts, 25% reinvestment"),
+    "assignment_protocol": (
+        "Assignment protocol",
+        "Friday 3pm ET ITM checks with CC pivot rules"),
+    "week_classification": (
+        "Week classification system",
+        "Normal, Earnings, FOMC, OpEx, Holiday week types with classification logic"),
+    "safe_active_reconciliation": (
+        "SAFE→ACTIVE state machine",
+        "SAFE→ACTIVE transitions with position and cash reconciliation"),
+    "earnings_filter": (
+        "Earnings filter",
+        "CSP earnings filter with data sources and timing buffer"),
+    "hedge_deployment": (
+        "Hedge deployment manager",
+        "1% SPX puts + 0.5% VIX calls at L2, budget 5-10% gains or 1% equity"),
+}
+
+
+def _expected_repr(value: Any) -> str:
+    """Render an expected value for a format template (sets sorted, braces escaped)."""
+    text = repr(sorted(value)) if isinstance(value, frozenset) else repr(value)
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+# Failure-message templates, formatted positionally with the spec's config values
+VALIDATOR_TEMPLATES: Dict[str, Tuple[str, str]] = {
+    name: (
+        ", ".join(f"{key}: {{!r}} (expected {_expected_repr(value)})" for key, value, _ in spec),
+        ", ".join(f"{key}={{}}" for key, _, _ in spec),
+    )
+    for name, spec in VALIDATOR_SPECS.items()
+}
+
+# Equality checks are folded into one (keys, expected values) tuple compare;
+# the remaining comparator checks run afterwards
+VALIDATOR_PLANS: Dict[str, Tuple[Tuple[str, ...], Tuple[Any, ...], List[Tuple[str, Any, Callable[[Any, Any], bool]]]]] = {
+    name: (
+        tuple(key for key, _, cmp in spec if cmp is operator.eq),
+        tuple(value for _, value, cmp in spec if cmp is operator.eq),
+        [check for check in spec if check[2] is not operator.eq],
+    )
+    for name, spec in VALIDATOR_SPECS.items()
+}
+
+
+@dataclass
+class TestResults:
+    """End-to-end test run counters."""
+    __test__ = False  # not a pytest test class
+    
+    total_tests: int = 0
+    passed_tests: int = 0
+    failed_tests: int = 0
+    execution_time: float = 0.0
+    
+    @property
+    def test_coverage(self) -> float:
+        """Percentage of executed tests that passed."""
+        return 0.0 if not self.total_tests else (self.passed_tests / self.total_tests) * 100.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the results as a plain dict, including coverage."""
+        return {**asdict(self), "test_coverage": self.test_coverage}
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """Outcome of a single GPT-5 correction validation."""
+    passed: bool
+    details: str = ""
+    expected: str = ""
+    actual: str = ""
+    error: str = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the populated fields as a plain dict."""
+        return {key: value for key, value in asdict(self).items() if value != ""}
+
+
+def _safe_validator(func: Callable[..., Awaitable[ValidationResult]]) -> Callable[..., Awaitable[ValidationResult]]:
+    """Turn exceptions raised by a GPT-5 validator into a failed ValidationResult."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs) -> ValidationResult:
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            return ValidationResult(False, error=str(e))
+    return wrapper
+
 
 class E2ETestSuite:
     """
@@ -25,16 +319,43 @@ class E2ETestSuite:
     and their interactions.
     """
     
+    # Integration and performance groups, as method names resolved per instance
+    INTEGRATION_TESTS = (
+        "_test_end_to_end_workflow",
+        "_test_cross_workstream_communication",
+        "_test_system_resilience",
+        "_test_data_consistency",
+        "_test_concurrent_operations",
+    )
+    
+    PERFORMANCE_TESTS = (
+        "_test_system_throughput",
+        "_test_response_times",
+        "_test_memory_usage",
+        "_test_scalability",
+        "_test_load_handling",
+    )
+    
+    # GPT-5 corrections validations: (test name, validator method name)
+    _GPT5_TESTS = (
+        ("ATR(5) Parameters", "_validate_atr_5_parameters"),
+        ("L0-L3 Protocol Levels", "_validate_protocol_levels"),
+        ("50% Roll Cost Threshold", "_validate_roll_cost_threshold"),
+        ("Liquidity Guards (OI≥500, Vol≥100, Spread≤5%)", "_validate_liquidity_guards"),
+        ("LLMS Specifications (0.25-0.35Δ)", "_validate_llms_specifications"),
+        ("Assignment Protocol (Friday 3pm)", "_validate_assignment_protocol"),
+        ("Week Classification System", "_validate_week_classification"),
+        ("SAFE→ACTIVE State Machine", "_validate_state_machine"),
+        ("Earnings Filter Implementation", "_validate_earnings_filter"),
+        ("Hedge Deployment (1% SPX + 0.5% VIX)", "_validate_hedge_deployment"),
+    )
+    
     def __init__(self):
         """Initialize the testing suite."""
         self.system = None
-        self.test_results = {
-            "total_tests": 0,
-            "passed_tests": 0,
-            "failed_tests": 0,
-            "test_coverage": 0.0,
-            "execution_time": 0.0
-        }
+        self.test_results = TestResults()
+        self._config_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._get_component: Optional[Callable[[str], Any]] = None
         
     async def setup_test_environment(self):
         """Set up the test environment."""
@@ -70,344 +391,57 @@ class E2ETestSuite:
             await self.setup_test_environment()
             
             # Run test suites
-            await self._run_ws1_tests()
-            await self._run_ws2_tests()
-            await self._run_ws3_tests()
-            await self._run_ws4_tests()
-            await self._run_ws5_tests()
-            await self._run_ws6_tests()
+            for group_name in WS_GROUP_TITLES:
+                await self._run_ws_tests(group_name)
             await self._run_integration_tests()
             await self._run_performance_tests()
             
-            # Calculate test coverage
-            self._calculate_test_coverage()
-            
         finally:
             await self.teardown_test_environment()
         
         end_time = datetime.utcnow()
-        self.test_results["execution_time"] = (end_time - start_time).total_seconds()
-        
-        return self.test_results
-    
-    async def _run_ws1_tests(self):
-        """Run WS1 Rules Engine tests."""
-        logger.info("Running WS1 Rules Engine tests...")
-        
-        tests = [
-            self._test_constitution_compliance,
-            self._test_rule_validation,
-            self._test_position_sizing,
-            self._test_audit_trail,
-            self._test_violation_detection
-        ]
-        
-        await self._execute_test_group("WS1", tests)
-    
-    async def _run_ws2_tests(self):
-        """Run WS2 Protocol Engine tests."""
-        logger.info("Running WS2 Protocol Engine tests...")
-        
-        tests = [
-            self._test_atr_calculation,
-            self._test_protocol_escalation,
-            self._test_roll_economics,
-            self._test_circuit_breakers,
-            self._test_risk_management
-        ]
-        
-        await self._execute_test_group("WS2", tests)
-    
-    async def _run_ws3_tests(self):
-        """Run WS3 Account Management tests."""
-        logger.info("Running WS3 Account Management tests...")
-        
-        tests = [
-            self._test_account_creation,
-            self._test_forking_logic,
-            self._test_account_merging,
-            self._test_performance_attribution,
-            self._test_account_hierarchy
-        ]
-        
-        await self._execute_test_group("WS3", tests)
-    
-    async def _run_ws4_tests(self):
-        """Run WS4 Market Data & Execution tests."""
-        logger.info("Running WS4 Market Data & Execution tests...")
+        self.test_results.execution_time = (end_time - start_time).total_seconds()
         
-        tests = [
-            self._test_market_data_feeds,
-            self._test_ib_integration,
-            self._test_trade_execution,
-            self._test_order_management,
-            self._test_market_monitoring
-        ]
-        
-        await self._execute_test_group("WS4", tests)
-    
-    async def _run_ws5_tests(self):
-        """Run WS5 Portfolio Management tests."""
-        logger.info("Running WS5 Portfolio Management tests...")
-        
-        tests = [
-            self._test_portfolio_optimization,
-            self._test_performance_measurement,
-            self._test_risk_analysis,
-            self._test_report_generation,
-            self._test_analytics_tools
-        ]
-        
-        await self._execute_test_group("WS5", tests)
+        return self.test_results.to_dict()
     
-    async def _run_ws6_tests(self):
-        """Run WS6 User Interface tests."""
-        logger.info("Running WS6 User Interface tests...")
+    async def _run_ws_tests(self, group_name: str):
+        """Run one workstream's test cases from WS_CASES."""
+        logger.info(f"Running {group_name} {WS_GROUP_TITLES[group_name]} tests...")
         
-        tests = [
-            self._test_api_gateway,
-            self._test_authentication,
-            self._test_web_dashboard,
-            self._test_trading_interface,
-            self._test_mobile_features
-        ]
-        
-        await self._execute_test_group("WS6", tests)
+        await self._execute_test_group(group_name, [
+            (name, functools.partial(self._check_case, call, check))
+            for group, name, call, check in WS_CASES
+            if group == group_name
+        ])
     
     async def _run_integration_tests(self):
         """Run system integration tests."""
         logger.info("Running system integration tests...")
         
-        tests = [
-            self._test_end_to_end_workflow,
-            self._test_cross_workstream_communication,
-            self._test_system_resilience,
-            self._test_data_consistency,
-            self._test_concurrent_operations
-        ]
-        
-        await self._execute_test_group("INTEGRATION", tests)
+        await self._execute_test_group("INTEGRATION", [(name, getattr(self, name)) for name in self.INTEGRATION_TESTS])
     
     async def _run_performance_tests(self):
         """Run system performance tests."""
         logger.info("Running system performance tests...")
         
-        tests = [
-            self._test_system_throughput,
-            self._test_response_times,
-            self._test_memory_usage,
-            self._test_scalability,
-            self._test_load_handling
-        ]
-        
-        await self._execute_test_group("PERFORMANCE", tests)
+        await self._execute_test_group("PERFORMANCE", [(name, getattr(self, name)) for name in self.PERFORMANCE_TESTS])
     
-    async def _execute_test_group(self, group_name: str, tests: List):
-        """Execute a group of tests."""
-        for test in tests:
+    async def _execute_test_group(self, group_name: str, tests: List[Tuple[str, Callable[[], Awaitable[Any]]]]):
+        """Execute a group of (test_name, test) pairs."""
+        for test_name, test in tests:
             try:
-                self.test_results["total_tests"] += 1
+                self.test_results.total_tests += 1
                 await test()
-                self.test_results["passed_tests"] += 1
-                logger.info(f"✅ {group_name}: {test.__name__} PASSED")
+                self.test_results.passed_tests += 1
+                logger.info(f"✅ {group_name}: {test_name} PASSED")
             except Exception as e:
-                self.test_results["failed_tests"] += 1
-                logger.error(f"❌ {group_name}: {test.__name__} FAILED - {e}")
-    
-    # WS1 Tests
-    async def _test_constitution_compliance(self):
-        """Test Constitution v1.3 compliance."""
-        # Test Constitution compliance
-        compliance_result = await self.system.rules_engine.check_constitution_compliance()
-        assert compliance_result["compliance_percentage"] == 100.0
-    
-    async def _test_rule_validation(self):
-        """Test rule validation system."""
-        # Test rule validation
-        test_rule = {"type": "position_size", "value": 0.95}
-        validation_result = await self.system.rules_engine.validate_rule(test_rule)
-        assert validation_result["is_valid"] is True
-    
-    async def _test_position_sizing(self):
-        """Test position sizing calculator."""
-        # Test position sizing
-        account_value = Decimal("100000")
-        position_size = await self.system.rules_engine.calculate_position_size(account_value)
-        assert Decimal("95000") <= position_size <= Decimal("100000")
-    
-    async def _test_audit_trail(self):
-        """Test audit trail system."""
-        # Test audit trail
-        audit_count = await self.system.rules_engine.get_audit_trail_count()
-        assert audit_count >= 0
-    
-    async def _test_violation_detection(self):
-        """Test violation detection system."""
-        # Test violation detection
-        violations = await self.system.rules_engine.get_recent_violations()
-        assert isinstance(violations, list)
-    
-    # WS2 Tests
-    async def _test_atr_calculation(self):
-        """Test ATR calculation engine."""
-        # Test ATR calculation
-        atr_value = await self.system.atr_engine.calculate_atr("SPY", 14)
-        assert atr_value > 0
-    
-    async def _test_protocol_escalation(self):
-        """Test protocol escalation system."""
-        # Test protocol escalation
-        current_level = await self.system.escalation_manager.get_current_level()
-        assert current_level in [0, 1, 2, 3]
-    
-    async def _test_roll_economics(self):
-        """Test roll economics calculator."""
-        # Test roll economics
-        roll_decision = await self.system.escalation_manager.evaluate_roll_opportunity("SPY")
-        assert "recommendation" in roll_decision
-    
-    async def _test_circuit_breakers(self):
-        """Test circuit breaker system."""
-        # Test circuit breakers
-        breaker_status = await self.system.escalation_manager.get_circuit_breaker_status()
-        assert "status" in breaker_status
-    
-    async def _test_risk_management(self):
-        """Test risk management system."""
-        # Test risk management
-        risk_metrics = await self.system.escalation_manager.get_risk_metrics()
-        assert "current_risk_level" in risk_metrics
-    
-    # WS3 Tests
-    async def _test_account_creation(self):
-        """Test account creation."""
-        # Test account creation
-        account_id = await self.system.account_manager.create_account("GEN", Decimal("10000"))
-        assert account_id is not None
-    
-    async def _test_forking_logic(self):
-        """Test forking logic."""
-        # Test forking logic
-        fork_opportunity = await self.system.account_manager.evaluate_fork_opportunity("test_account")
-        assert "should_fork" in fork_opportunity
-    
-    async def _test_account_merging(self):
-        """Test account merging."""
-        # Test account merging
-        merge_opportunity = await self.system.account_manager.evaluate_merge_opportunity("test_account")
-        assert "should_merge" in merge_opportunity
-    
-    async def _test_performance_attribution(self):
-        """Test performance attribution."""
-        # Test performance attribution
-        performance = await self.system.account_manager.get_account_performance("test_account")
-        assert "total_return" in performance
-    
-    async def _test_account_hierarchy(self):
-        """Test account hierarchy."""
-        # Test account hierarchy
-        hierarchy = await self.system.account_manager.get_account_hierarchy()
-        assert isinstance(hierarchy, dict)
-    
-    # WS4 Tests
-    async def _test_market_data_feeds(self):
-        """Test market data feeds."""
-        # Test market data feeds
-        quote = await self.system.market_data_manager.get_quote("SPY")
-        assert "bid" in quote and "ask" in quote
-    
-    async def _test_ib_integration(self):
-        """Test Interactive Brokers integration."""
-        # Test IB integration
-        connection_status = await self.system.market_data_manager.get_connection_status()
-        assert "status" in connection_status
-    
-    async def _test_trade_execution(self):
-        """Test trade execution."""
-        # Test trade execution
-        order = {
-            "symbol": "SPY",
-            "quantity": 100,
-            "order_type": "MARKET",
-            "side": "BUY"
-        }
-        execution_result = await self.system.execution_engine.submit_order(order)
-        assert "order_id" in execution_result
-    
-    async def _test_order_management(self):
-        """Test order management."""
-        # Test order management
-        orders = await self.system.execution_engine.get_all_orders()
-        assert isinstance(orders, list)
-    
-    async def _test_market_monitoring(self):
-        """Test market monitoring."""
-        # Test market monitoring
-        market_status = await self.system.market_data_manager.get_market_status()
-        assert "is_open" in market_status
-    
-    # WS5 Tests
-    async def _test_portfolio_optimization(self):
-        """Test portfolio optimization."""
-        # Test portfolio optimization
-        portfolio = ["SPY", "QQQ", "IWM"]
-        optimization_result = await self.system.portfolio_optimizer.optimize_portfolio(portfolio)
-        assert "weights" in optimization_result
-    
-    async def _test_performance_measurement(self):
-        """Test performance measurement."""
-        # Test performance measurement
-        performance = await self.system.portfolio_optimizer.calculate_performance("test_portfolio")
-        assert "sharpe_ratio" in performance
-    
-    async def _test_risk_analysis(self):
-        """Test risk analysis."""
-        # Test risk analysis
-        risk_analysis = await self.system.portfolio_optimizer.analyze_risk("test_portfolio")
-        assert "var" in risk_analysis
-    
-    async def _test_report_generation(self):
-        """Test report generation."""
-        # Test report generation
-        report = await self.system.portfolio_optimizer.generate_report("test_portfolio")
-        assert "report_id" in report
-    
-    async def _test_analytics_tools(self):
-        """Test analytics tools."""
-        # Test analytics tools
-        analytics = await self.system.portfolio_optimizer.get_analytics("test_portfolio")
-        assert isinstance(analytics, dict)
-    
-    # WS6 Tests
-    async def _test_api_gateway(self):
-        """Test API gateway."""
-        # Test API gateway
-        gateway_status = await self.system.api_gateway.get_status()
-        assert "status" in gateway_status
-    
-    async def _test_authentication(self):
-        """Test authentication system."""
-        # Test authentication
-        auth_result = await self.system.api_gateway.authenticate_user("test_user", "test_password")
-        assert "token" in auth_result or "error" in auth_result
-    
-    async def _test_web_dashboard(self):
-        """Test web dashboard."""
-        # Test web dashboard
-        dashboard_data = await self.system.api_gateway.get_dashboard_data()
-        assert isinstance(dashboard_data, dict)
-    
-    async def _test_trading_interface(self):
-        """Test trading interface."""
-        # Test trading interface
-        trading_data = await self.system.api_gateway.get_trading_data()
-        assert isinstance(trading_data, dict)
-    
-    async def _test_mobile_features(self):
-        """Test mobile features."""
-        # Test mobile features
-        mobile_data = await self.system.api_gateway.get_mobile_data()
-        assert isinstance(mobile_data, dict)
+                self.test_results.failed_tests += 1
+                logger.error(f"❌ {group_name}: {test_name} FAILED - {e}")
+    
+    async def _check_case(self, call: Callable[[Any], Awaitable[Any]], check: Callable[[Any], bool]):
+        """Run a WS_CASES call against the system and assert its check."""
+        result = await call(self.system)
+        assert check(result), f"unexpected result: {result!r}"
     
     # Integration Tests
     async def _test_end_to_end_workflow(self):
@@ -512,49 +546,30 @@ class E2ETestSuite:
         """Test system load handling."""
         return {"handles_load": True}
     
-    def _calculate_test_coverage(self):
-        """Calculate test coverage."""
-        total_tests = self.test_results["total_tests"]
-        passed_tests = self.test_results["passed_tests"]
+    async def run_gpt5_corrections_validation(self) -> Dict[str, Any]:
+        """Run GPT-5 corrections validation tests against a fresh system."""
+        try:
+            # Setup test environment
+            await self.setup_test_environment()
+            
+            return await self.validate_gpt5_corrections()
+            
+        except Exception as e:
+            logger.error(f"Error running GPT-5 corrections validation: {e}")
+            return {
+                "overall_success": False,
+                "total_tests": 0,
+                "passed_tests": 0,
+                "failed_tests": 0,
+                "validations": [],
+                "error": str(e)
+            }
         
-        if total_tests > 0:
-            self.test_results["test_coverage"] = (passed_tests / total_tests) * 100.0
-        else:
-            self.test_results["test_coverage"] = 0.0
-
-
-# Main test runner
-async def run_tests():
-    """Run the complete test suite."""
-    test_suite = E2ETestSuite()
-    results = await test_suite.run_all_tests()
-    
-    print("\n" + "="*50)
-    print("TRUE-ASSET-ALLUSE SYSTEM TEST RESULTS")
-    print("="*50)
-    print(f"Total Tests: {results['total_tests']}")
-    print(f"Passed: {results['passed_tests']}")
-    print(f"Failed: {results['failed_tests']}")
-    print(f"Test Coverage: {results['test_coverage']:.2f}%")
-    print(f"Execution Time: {results['execution_time']:.2f} seconds")
-    print("="*50)
-    
-    return results
-
-
-if __name__ == "__main__":
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+        finally:
+            await self.teardown_test_environment()
     
-    # Run tests
-    asyncio.run(run_tests())
-
-
-    async def run_gpt5_corrections_validation(self) -> Dict[str, Any]:
-        """Run GPT-5 corrections validation tests."""
+    async def validate_gpt5_corrections(self) -> Dict[str, Any]:
+        """Run the GPT-5 corrections validations against the current system."""
         logger.info("Running GPT-5 corrections validation...")
         
         validation_results = {
@@ -565,377 +580,176 @@ if __name__ == "__main__":
             "validations": []
         }
         
-        try:
-            # Setup test environment
-            await self.setup_test_environment()
-            
-            # Run GPT-5 specific validations
-            gpt5_tests = [
-                ("ATR(5) Parameters", self._validate_atr_5_parameters),
-                ("L0-L3 Protocol Levels", self._validate_protocol_levels),
-                ("50% Roll Cost Threshold", self._validate_roll_cost_threshold),
-                ("Liquidity Guards (OI≥500, Vol≥100, Spread≤5%)", self._validate_liquidity_guards),
-                ("LLMS Specifications (0.25-0.35Δ)", self._validate_llms_specifications),
-                ("Assignment Protocol (Friday 3pm)", self._validate_assignment_protocol),
-                ("Week Classification System", self._validate_week_classification),
-                ("SAFE→ACTIVE State Machine", self._validate_state_machine),
-                ("Earnings Filter Implementation", self._validate_earnings_filter),
-                ("Hedge Deployment (1% SPX + 0.5% VIX)", self._validate_hedge_deployment)
-            ]
-            
-            for test_name, test_method in gpt5_tests:
-                logger.info(f"Validating: {test_name}")
-                try:
-                    result = await test_method()
-                    validation_results["total_tests"] += 1
-                    
-                    if result["passed"]:
-                        validation_results["passed_tests"] += 1
-                        logger.info(f"✅ {test_name}: PASSED")
-                    else:
-                        validation_results["failed_tests"] += 1
-                        validation_results["overall_success"] = False
-                        logger.error(f"❌ {test_name}: FAILED - {result.get('details', 'No details')}")
-                    
-                    validation_results["validations"].append({
-                        "test_name": test_name,
-                        "result": result
-                    })
-                    
-                except Exception as e:
-                    validation_results["total_tests"] += 1
-                    validation_results["failed_tests"] += 1
-                    validation_results["overall_success"] = False
-                    logger.error(f"❌ {test_name}: ERROR - {e}")
-                    
-                    validation_results["validations"].append({
-                        "test_name": test_name,
-                        "result": {
-                            "passed": False,
-                            "error": str(e)
-                        }
-                    })
-            
-            # Generate summary
-            success_rate = (validation_results["passed_tests"] / validation_results["total_tests"]) * 100 if validation_results["total_tests"] > 0 else 0
-            
-            logger.info(f"GPT-5 Corrections Validation Complete:")
-            logger.info(f"  Total Tests: {validation_results['total_tests']}")
-            logger.info(f"  Passed: {validation_results['passed_tests']}")
-            logger.info(f"  Failed: {validation_results['failed_tests']}")
-            logger.info(f"  Success Rate: {success_rate:.1f}%")
-            logger.info(f"  Overall: {'✅ PASSED' if validation_results['overall_success'] else '❌ FAILED'}")
-            
-            return validation_results
-            
-        except Exception as e:
-            logger.error(f"Error running GPT-5 corrections validation: {e}")
-            validation_results["overall_success"] = False
-            validation_results["error"] = str(e)
-            return validation_results
+        # Each run reads fresh component configuration from the current system
+        self._config_cache.clear()
+        self._get_component = self.system.get_component
         
-        finally:
-            await self.teardown_test_environment()
+        # Run GPT-5 specific validations concurrently; counters are only
+        # updated after gather returns, so the tasks share no mutable state
+        raw_results = await asyncio.gather(
+            *(getattr(self, method_name)() for _, method_name in self._GPT5_TESTS),
+            return_exceptions=True
+        )
+        
+        for (test_name, _), result in zip(self._GPT5_TESTS, raw_results):
+            validation_results["total_tests"] += 1
+            
+            if isinstance(result, Exception):
+                validation_results["failed_tests"] += 1
+                validation_results["overall_success"] = False
+                logger.error(f"❌ {test_name}: ERROR - {result}")
+                result = ValidationResult(False, error=str(result))
+            elif result.passed:
+                validation_results["passed_tests"] += 1
+                logger.info(f"✅ {test_name}: PASSED")
+            else:
+                validation_results["failed_tests"] += 1
+                validation_results["overall_success"] = False
+                logger.error(f"❌ {test_name}: FAILED - {result.details or 'No details'}")
+            
+            validation_results["validations"].append({
+                "test_name": test_name,
+                "result": result.to_dict()
+            })
+        
+        # Generate summary
+        success_rate = (validation_results["passed_tests"] / validation_results["total_tests"]) * 100 if validation_results["total_tests"] > 0 else 0
+        
+        logger.info(f"GPT-5 Corrections Validation Complete:")
+        logger.info(f"  Total Tests: {validation_results['total_tests']}")
+        logger.info(f"  Passed: {validation_results['passed_tests']}")
+        logger.info(f"  Failed: {validation_results['failed_tests']}")
+        logger.info(f"  Success Rate: {success_rate:.1f}%")
+        logger.info(f"  Overall: {'✅ PASSED' if validation_results['overall_success'] else '❌ FAILED'}")
+        
+        return validation_results
     
     # GPT-5 Specific Validation Methods
     
-    async def _validate_atr_5_parameters(self) -> Dict[str, Any]:
+    def _get_config(self, component_name: str) -> Optional[Dict[str, Any]]:
+        """Get a component's configuration, cached for the current validation run."""
+        if component_name not in self._config_cache:
+            component = self._get_component(component_name)
+            self._config_cache[component_name] = component.get_configuration() if component else None
+        return self._config_cache[component_name]
+    
+    @_safe_validator
+    async def _run_spec(self, component_name: str) -> ValidationResult:
+        """Check a component's configuration against its VALIDATOR_SPECS entry."""
+        label, expected = VALIDATOR_LABELS[component_name]
+        config = self._get_config(component_name)
+        if config is None:
+            return ValidationResult(False, details=f"{label} not found")
+        
+        config_get = config.get
+        eq_keys, eq_values, checks = VALIDATOR_PLANS[component_name]
+        if (tuple(map(config_get, eq_keys)) == eq_values
+                and all(cmp(config_get(key), value) for key, value, cmp in checks)):
+            return ValidationResult(True)
+        
+        # Only failures carry the descriptive strings
+        values = [config_get(key) for key, _, _ in VALIDATOR_SPECS[component_name]]
+        details_template, actual_template = VALIDATOR_TEMPLATES[component_name]
+        return ValidationResult(
+            False,
+            details=details_template.format(*values),
+            expected=expected,
+            actual=actual_template.format(*values)
+        )
+    
+    async def _validate_atr_5_parameters(self) -> ValidationResult:
         """Validate ATR(5) parameters per GPT-5 feedback."""
-        try:
-            atr_engine = self.system.get_component("atr_engine")
-            if not atr_engine:
-                return {"passed": False, "details": "ATR engine not found"}
-            
-            config = atr_engine.get_configuration()
-            
-            # Check ATR period is 5 (not 14)
-            period_correct = config.get("period") == 5
-            
-            # Check 9:30 ET refresh time
-            refresh_correct = config.get("refresh_time") == "09:30"
-            timezone_correct = config.get("timezone") == "US/Eastern"
-            
-            # Check 24h staleness guard
-            staleness_guard = config.get("staleness_guard_hours") == 24
-            fallback_multiplier = config.get("fallback_multiplier") == 1.1
-            
-            passed = all([period_correct, refresh_correct, timezone_correct, staleness_guard, fallback_multiplier])
-            
-            return {
-                "passed": passed,
-                "details": f"Period: {config.get('period')} (expected 5), Refresh: {config.get('refresh_time')} {config.get('timezone')} (expected 09:30 US/Eastern), Staleness: {config.get('staleness_guard_hours')}h, Fallback: {config.get('fallback_multiplier')}x",
-                "expected": "ATR(5) with 9:30 ET refresh, 24h staleness guard, 1.1x fallback",
-                "actual": f"ATR({config.get('period')}) with {config.get('refresh_time')} {config.get('timezone')} refresh, {config.get('staleness_guard_hours')}h staleness, {config.get('fallback_multiplier')}x fallback"
-            }
-            
-        except Exception as e:
-            return {"passed": False, "error": str(e)}
+        return await self._run_spec("atr_engine")
     
-    async def _validate_protocol_levels(self) -> Dict[str, Any]:
+    @_safe_validator
+    async def _validate_protocol_levels(self) -> ValidationResult:
         """Validate L0-L3 protocol levels per GPT-5 feedback."""
-        try:
-            escalation_manager = self.system.get_component("escalation_manager")
-            if not escalation_manager:
-                return {"passed": False, "details": "Escalation manager not found"}
-            
-            levels = escalation_manager.get_protocol_levels()
-            expected_levels = ["L0", "L1", "L2", "L3"]
-            
-            # Check all expected levels exist
-            levels_exist = all(level in levels for level in expected_levels)
-            
-            # Check level descriptions match Constitution
-            l0_correct = "Normal" in levels.get("L0", {}).get("description", "")
-            l1_correct = "Prep" in levels.get("L1", {}).get("description", "")
-            l2_correct = "Roll + Hedge" in levels.get("L2", {}).get("description", "")
-            l3_correct = "Stop-loss + SAFE" in levels.get("L3", {}).get("description", "")
-            
-            passed = levels_exist and l0_correct and l1_correct and l2_correct and l3_correct
-            
-            return {
-                "passed": passed,
-                "details": f"Available levels: {list(levels.keys())}, Descriptions validated: L0={l0_correct}, L1={l1_correct}, L2={l2_correct}, L3={l3_correct}",
-                "expected": "L0 (Normal), L1 (Prep), L2 (Roll + Hedge), L3 (Stop-loss + SAFE)",
-                "actual": f"Levels: {list(levels.keys())}"
-            }
-            
-        except Exception as e:
-            return {"passed": False, "error": str(e)}
-    
-    async def _validate_roll_cost_threshold(self) -> Dict[str, Any]:
+        escalation_manager = self._get_component("escalation_manager")
+        if not escalation_manager:
+            return ValidationResult(False, details="Escalation manager not found")
+        
+        levels = escalation_manager.get_protocol_levels()
+        expected_levels = ["L0", "L1", "L2", "L3"]
+        
+        def description_matches(level: str, text: str) -> bool:
+            return text in levels.get(level, {}).get("description", "")
+        
+        # Check level descriptions match the Constitution
+        l0_correct = description_matches("L0", "Normal")
+        l1_correct = description_matches("L1", "Prep")
+        l2_correct = description_matches("L2", "Roll + Hedge")
+        l3_correct = description_matches("L3", "Stop-loss + SAFE")
+        
+        # Check all expected levels exist and are correctly described
+        if (all(level in levels for level in expected_levels)
+                and l0_correct and l1_correct and l2_correct and l3_correct):
+            return ValidationResult(True)
+        
+        return ValidationResult(
+            False,
+            details=f"Available levels: {list(levels.keys())}, Descriptions validated: L0={l0_correct}, L1={l1_correct}, L2={l2_correct}, L3={l3_correct}",
+            expected="L0 (Normal), L1 (Prep), L2 (Roll + Hedge), L3 (Stop-loss + SAFE)",
+            actual=f"Levels: {list(levels.keys())}"
+        )
+    
+    async def _validate_roll_cost_threshold(self) -> ValidationResult:
         """Validate 50% roll cost threshold per GPT-5 feedback."""
-        try:
-            roll_cost_threshold = self.system.get_component("roll_cost_threshold")
-            if not roll_cost_threshold:
-                return {"passed": False, "details": "Roll cost threshold component not found"}
-            
-            config = roll_cost_threshold.get_configuration()
-            threshold_correct = config.get("max_cost_threshold_pct") == 50.0
-            escalate_on_exceed = config.get("escalate_to_l3_on_exceed") == True
-            
-            passed = threshold_correct and escalate_on_exceed
-            
-            return {
-                "passed": passed,
-                "details": f"Threshold: {config.get('max_cost_threshold_pct')}% (expected 50%), Escalate to L3: {config.get('escalate_to_l3_on_exceed')}",
-                "expected": "50% threshold with L3 escalation",
-                "actual": f"{config.get('max_cost_threshold_pct')}% threshold, L3 escalation: {config.get('escalate_to_l3_on_exceed')}"
-            }
-            
-        except Exception as e:
-            return {"passed": False, "error": str(e)}
+        return await self._run_spec("roll_cost_threshold")
     
-    async def _validate_liquidity_guards(self) -> Dict[str, Any]:
+    async def _validate_liquidity_guards(self) -> ValidationResult:
         """Validate liquidity guards per GPT-5 feedback."""
-        try:
-            liquidity_validator = self.system.get_component("liquidity_validator")
-            if not liquidity_validator:
-                return {"passed": False, "details": "Liquidity validator not found"}
-            
-            config = liquidity_validator.get_configuration()
-            
-            oi_correct = config.get("min_open_interest") >= 500
-            volume_correct = config.get("min_daily_volume") >= 100
-            spread_correct = config.get("max_bid_ask_spread_pct") <= 5.0
-            adv_limit_correct = config.get("max_order_size_pct_of_adv") <= 10.0
-            
-            passed = oi_correct and volume_correct and spread_correct and adv_limit_correct
-            
-            return {
-                "passed": passed,
-                "details": f"OI: {config.get('min_open_interest')} (≥500), Vol: {config.get('min_daily_volume')} (≥100), Spread: {config.get('max_bid_ask_spread_pct')}% (≤5%), ADV: {config.get('max_order_size_pct_of_adv')}% (≤10%)",
-                "expected": "OI ≥ 500, Vol ≥ 100, Spread ≤ 5%, Order ≤ 10% ADV",
-                "actual": f"OI ≥ {config.get('min_open_interest')}, Vol ≥ {config.get('min_daily_volume')}, Spread ≤ {config.get('max_bid_ask_spread_pct')}%, Order ≤ {config.get('max_order_size_pct_of_adv')}% ADV"
-            }
-            
-        except Exception as e:
-            return {"passed": False, "error": str(e)}
+        return await self._run_spec("liquidity_validator")
     
-    async def _validate_llms_specifications(self) -> Dict[str, Any]:
+    async def _validate_llms_specifications(self) -> ValidationResult:
         """Validate LLMS specifications per GPT-5 feedback."""
-        try:
-            llms_specs = self.system.get_component("llms_specifications")
-            if not llms_specs:
-                return {"passed": False, "details": "LLMS specifications not found"}
-            
-            config = llms_specs.get_configuration()
-            
-            # Check delta ranges for calls (0.25-0.35)
-            min_delta_correct = config.get("call_min_delta") == 0.25
-            max_delta_correct = config.get("call_max_delta") == 0.35
-            
-            # Check OTM puts (10-20%)
-            otm_put_min = config.get("put_otm_min_pct") == 10
-            otm_put_max = config.get("put_otm_max_pct") == 20
-            
-            # Check reinvestment allocation (25%)
-            reinvestment_correct = config.get("reinvestment_allocation_pct") == 25
-            
-            passed = min_delta_correct and max_delta_correct and otm_put_min and otm_put_max and reinvestment_correct
-            
-            return {
-                "passed": passed,
-                "details": f"Call Delta: {config.get('call_min_delta')}-{config.get('call_max_delta')} (expected 0.25-0.35), Put OTM: {config.get('put_otm_min_pct')}-{config.get('put_otm_max_pct')}% (expected 10-20%), Reinvestment: {config.get('reinvestment_allocation_pct')}% (expected 25%)",
-                "expected": "0.25-0.35Δ calls, 10-20% OTM puts, 25% reinvestment",
-                "actual": f"{config.get('call_min_delta')}-{config.get('call_max_delta')}Δ calls, {config.get('put_otm_min_pct')}-{config.get('put_otm_max_pct')}% OTM puts, {config.get('reinvestment_allocation_pct')}% reinvestment"
-            }
-            
-        except Exception as e:
-            return {"passed": False, "error": str(e)}
+        return await self._run_spec("llms_specifications")
     
-    async def _validate_assignment_protocol(self) -> Dict[str, Any]:
+    async def _validate_assignment_protocol(self) -> ValidationResult:
         """Validate assignment protocol per GPT-5 feedback."""
-        try:
-            assignment_protocol = self.system.get_component("assignment_protocol")
-            if not assignment_protocol:
-                return {"passed": False, "details": "Assignment protocol not found"}
-            
-            config = assignment_protocol.get_configuration()
-            
-            # Check Friday 3pm ET check
-            friday_time_correct = config.get("friday_check_time") == "15:00"
-            timezone_correct = config.get("timezone") == "US/Eastern"
-            
-            # Check ITM threshold
-            itm_threshold_correct = config.get("itm_threshold") == 0.01  # 1 cent ITM
-            
-            # Check CC pivot rules
-            cc_pivot_enabled = config.get("cc_pivot_enabled") == True
-            
-            passed = friday_time_correct and timezone_correct and itm_threshold_correct and cc_pivot_enabled
-            
-            return {
-                "passed": passed,
-                "details": f"Friday check: {config.get('friday_check_time')} {config.get('timezone')} (expected 15:00 US/Eastern), ITM threshold: ${config.get('itm_threshold')} (expected $0.01), CC pivot: {config.get('cc_pivot_enabled')}",
-                "expected": "Friday 3pm ET ITM checks with CC pivot rules",
-                "actual": f"Friday {config.get('friday_check_time')} {config.get('timezone')} ITM checks, CC pivot: {config.get('cc_pivot_enabled')}"
-            }
-            
-        except Exception as e:
-            return {"passed": False, "error": str(e)}
+        return await self._run_spec("assignment_protocol")
     
-    async def _validate_week_classification(self) -> Dict[str, Any]:
+    async def _validate_week_classification(self) -> ValidationResult:
         """Validate week classification system per GPT-5 feedback."""
-        try:
-            week_classification = self.system.get_component("week_classification")
-            if not week_classification:
-                return {"passed": False, "details": "Week classification system not found"}
-            
-            config = week_classification.get_configuration()
-            
-            # Check week types
-            week_types = config.get("week_types", [])
-            expected_types = ["Normal", "Earnings", "FOMC", "OpEx", "Holiday"]
-            types_correct = all(wtype in week_types for wtype in expected_types)
-            
-            # Check classification logic
-            earnings_logic = config.get("earnings_classification_enabled") == True
-            fomc_logic = config.get("fomc_classification_enabled") == True
-            opex_logic = config.get("opex_classification_enabled") == True
-            
-            passed = types_correct and earnings_logic and fomc_logic and opex_logic
-            
-            return {
-                "passed": passed,
-                "details": f"Week types: {week_types} (expected {expected_types}), Earnings logic: {earnings_logic}, FOMC logic: {fomc_logic}, OpEx logic: {opex_logic}",
-                "expected": "Normal, Earnings, FOMC, OpEx, Holiday week types with classification logic",
-                "actual": f"Types: {week_types}, Classification enabled: Earnings={earnings_logic}, FOMC={fomc_logic}, OpEx={opex_logic}"
-            }
-            
-        except Exception as e:
-            return {"passed": False, "error": str(e)}
+        return await self._run_spec("week_classification")
     
-    async def _validate_state_machine(self) -> Dict[str, Any]:
+    async def _validate_state_machine(self) -> ValidationResult:
         """Validate SAFE→ACTIVE state machine per GPT-5 feedback."""
-        try:
-            state_machine = self.system.get_component("safe_active_reconciliation")
-            if not state_machine:
-                return {"passed": False, "details": "SAFE→ACTIVE state machine not found"}
-            
-            config = state_machine.get_configuration()
-            
-            # Check state transitions
-            safe_to_active = config.get("safe_to_active_enabled") == True
-            reconciliation_enabled = config.get("reconciliation_enabled") == True
-            
-            # Check reconciliation process
-            position_reconciliation = config.get("position_reconciliation_enabled") == True
-            cash_reconciliation = config.get("cash_reconciliation_enabled") == True
-            
-            passed = safe_to_active and reconciliation_enabled and position_reconciliation and cash_reconciliation
-            
-            return {
-                "passed": passed,
-                "details": f"SAFE→ACTIVE: {safe_to_active}, Reconciliation: {reconciliation_enabled}, Position reconciliation: {position_reconciliation}, Cash reconciliation: {cash_reconciliation}",
-                "expected": "SAFE→ACTIVE transitions with position and cash reconciliation",
-                "actual": f"Transitions: {safe_to_active}, Reconciliation: {reconciliation_enabled}, Position: {position_reconciliation}, Cash: {cash_reconciliation}"
-            }
-            
-        except Exception as e:
-            return {"passed": False, "error": str(e)}
+        return await self._run_spec("safe_active_reconciliation")
     
-    async def _validate_earnings_filter(self) -> Dict[str, Any]:
+    async def _validate_earnings_filter(self) -> ValidationResult:
         """Validate earnings filter per GPT-5 feedback."""
-        try:
-            earnings_filter = self.system.get_component("earnings_filter")
-            if not earnings_filter:
-                return {"passed": False, "details": "Earnings filter not found"}
-            
-            config = earnings_filter.get_configuration()
-            
-            # Check CSP earnings avoidance
-            csp_earnings_filter = config.get("csp_earnings_filter_enabled") == True
-            
-            # Check earnings data sources
-            data_sources = config.get("earnings_data_sources", [])
-            has_data_sources = len(data_sources) > 0
-            
-            # Check filter timing
-            filter_days_before = config.get("filter_days_before_earnings") >= 1
-            filter_days_after = config.get("filter_days_after_earnings") >= 1
-            
-            passed = csp_earnings_filter and has_data_sources and filter_days_before and filter_days_after
-            
-            return {
-                "passed": passed,
-                "details": f"CSP filter: {csp_earnings_filter}, Data sources: {len(data_sources)}, Days before: {config.get('filter_days_before_earnings')}, Days after: {config.get('filter_days_after_earnings')}",
-                "expected": "CSP earnings filter with data sources and timing buffer",
-                "actual": f"Filter: {csp_earnings_filter}, Sources: {len(data_sources)}, Before: {config.get('filter_days_before_earnings')}d, After: {config.get('filter_days_after_earnings')}d"
-            }
-            
-        except Exception as e:
-            return {"passed": False, "error": str(e)}
+        return await self._run_spec("earnings_filter")
     
-    async def _validate_hedge_deployment(self) -> Dict[str, Any]:
+    async def _validate_hedge_deployment(self) -> ValidationResult:
         """Validate hedge deployment per GPT-5 feedback."""
-        try:
-            hedge_deployment = self.system.get_component("hedge_deployment")
-            if not hedge_deployment:
-                return {"passed": False, "details": "Hedge deployment manager not found"}
-            
-            config = hedge_deployment.get_configuration()
-            
-            # Check hedge allocation (1% SPX + 0.5% VIX)
-            spx_allocation = config.get("spx_put_allocation_pct") == 1.0
-            vix_allocation = config.get("vix_call_allocation_pct") == 0.5
-            
-            # Check budget calculation
-            budget_min_pct = config.get("budget_min_pct_quarterly_gains") == 5.0
-            budget_max_pct = config.get("budget_max_pct_quarterly_gains") == 10.0
-            budget_fallback_pct = config.get("budget_fallback_pct_sleeve_equity") == 1.0
-            
-            # Check L2 trigger
-            l2_trigger = config.get("deploy_at_protocol_l2") == True
-            
-            passed = spx_allocation and vix_allocation and budget_min_pct and budget_max_pct and budget_fallback_pct and l2_trigger
-            
-            return {
-                "passed": passed,
-                "details": f"SPX: {config.get('spx_put_allocation_pct')}% (expected 1%), VIX: {config.get('vix_call_allocation_pct')}% (expected 0.5%), Budget: {config.get('budget_min_pct_quarterly_gains')}-{config.get('budget_max_pct_quarterly_gains')}% gains or {config.get('budget_fallback_pct_sleeve_equity')}% equity, L2 trigger: {config.get('deploy_at_protocol_l2')}",
-                "expected": "1% SPX puts + 0.5% VIX calls at L2, budget 5-10% gains or 1% equity",
-                "actual": f"{config.get('spx_put_allocation_pct')}% SPX + {config.get('vix_call_allocation_pct')}% VIX at L2, budget {config.get('budget_min_pct_quarterly_gains')}-{config.get('budget_max_pct_quarterly_gains')}% gains or {config.get('budget_fallback_pct_sleeve_equity')}% equity"
-            }
-            
-        except Exception as e:
-            return {"passed": False, "error": str(e)}
+        return await self._run_spec("hedge_deployment")
+
+
+# Main test runner
+async def run_tests():
+    """Run the complete test suite."""
+    test_suite = E2ETestSuite()
+    results = await test_suite.run_all_tests()
+    
+    print("\n" + "="*50)
+    print("TRUE-ASSET-ALLUSE SYSTEM TEST RESULTS")
+    print("="*50)
+    print(f"Total Tests: {results['total_tests']}")
+    print(f"Passed: {results['passed_tests']}")
+    print(f"Failed: {results['failed_tests']}")
+    print(f"Test Coverage: {results['test_coverage']:.2f}%")
+    print(f"Execution Time: {results['execution_time']:.2f} seconds")
+    print("="*50)
+    
+    return results
 
+
+if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    # Run tests
+    asyncio.run(run_tests())
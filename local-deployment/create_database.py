@@ -21,9 +21,13 @@ def create_database():
     
     print(f"🗄️  Creating database at: {db_path}")
     
-    # Connect to database (creates file if it doesn't exist)
-    conn = sqlite3.connect(str(db_path))
+    # Connect to database (creates file if it doesn't exist); autocommit mode
+    # so the schema, reset and seed below share one explicit transaction
+    conn = sqlite3.connect(str(db_path), isolation_level=None)
     cursor = conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("BEGIN")
     
     # Create portfolio table
     cursor.execute("""
@@ -74,7 +78,7 @@ def create_database():
     """, portfolio_data)
     
     # Commit changes
-    conn.commit()
+    cursor.execute("COMMIT")
     
     # Verify data
     cursor.execute("SELECT COUNT(*) FROM portfolio")
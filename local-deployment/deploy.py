@@ -67,13 +67,24 @@ class TrueAssetDeployer:
         except OSError:
             return False
             
+    def wait_for_exit(self, pid, timeout=10.0):
+        """Poll until the process exits, returning False if it outlives the timeout"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                os.kill(pid, 0)  # Check if process still exists
+            except ProcessLookupError:
+                return True
+            time.sleep(0.05)
+        return False
+        
     def stop_existing_deployment(self):
         """Stop any existing deployment"""
         if self.pid_file.exists():
             try:
                 pid = int(self.pid_file.read_text().strip())
                 os.kill(pid, signal.SIGTERM)
-                time.sleep(2)
+                self.wait_for_exit(pid)
                 self.pid_file.unlink()
                 self.log("   ✅ Stopped existing deployment")
             except (ProcessLookupError, ValueError):
@@ -173,13 +184,7 @@ class TrueAssetDeployer:
             os.kill(pid, signal.SIGTERM)
             
             # Wait for graceful shutdown
-            for _ in range(10):
-                try:
-                    os.kill(pid, 0)  # Check if process still exists
-                    time.sleep(1)
-                except ProcessLookupError:
-                    break
-            else:
+            if not self.wait_for_exit(pid):
                 # Force kill if still running
                 try:
                     os.kill(pid, signal.SIGKILL)
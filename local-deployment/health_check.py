@@ -351,30 +351,24 @@ class TrueAssetHealthChecker:
             
             # Load configuration
             config = self.load_configuration()
-            time.sleep(0.5)
             
             # Check if application is running
             app_running = self.check_application_running()
             if not app_running:
                 self.log("❌ Application is not running - cannot perform full health check", "ERROR")
                 return False, None
-            time.sleep(0.5)
             
             # Run endpoint health checks
             endpoint_results, healthy_count = self.run_endpoint_health_checks()
-            time.sleep(0.5)
             
             # Check database health
             db_healthy = self.check_database_health()
-            time.sleep(0.5)
             
             # Run performance tests
             performance_results = self.run_performance_tests()
-            time.sleep(0.5)
             
             # Check system resources
             self.check_system_resources()
-            time.sleep(0.5)
             
             # Generate report
             report = self.generate_health_report(
@@ -5,11 +5,23 @@ Defines custom exception classes for different types of errors that can occur
 in the True-Asset-ALLUSE system, providing structured error handling.
 """
 
-from typing import Optional, Dict, Any
+import copyreg
+from typing import Optional, Dict, Any, Tuple
 
 
 class TrueAssetException(Exception):
-    """Base exception class for True-Asset-ALLUSE."""
+    """Base exception class for True-Asset-ALLUSE.
+    
+    Subclasses keep their context arguments as attributes named in
+    ``_detail_fields``; the ``details`` dict is only built when first read,
+    so exceptions raised and caught internally never allocate it. All
+    instance state lives in ``__slots__``, so the per-instance ``__dict__``
+    is never materialised either; ``__reduce__`` carries the slots so the
+    exceptions still survive pickling and copying.
+    """
+    
+    __slots__ = ("message", "error_code", "status_code", "_details")
+    _detail_fields: Tuple[str, ...] = ()
     
     def __init__(
         self,
@@ -21,133 +33,185 @@ class TrueAssetException(Exception):
         self.message = message
         self.error_code = error_code
         self.status_code = status_code
-        self.details = details or {}
+        self._details = details or None
         super().__init__(self.message)
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        """Structured error details, built on first access."""
+        if self._details is None:
+            self._details = self._build_details()
+        return self._details
+    
+    @details.setter
+    def details(self, value: Dict[str, Any]) -> None:
+        self._details = value
+    
+    def _build_details(self) -> Dict[str, Any]:
+        """Build the details dict from the subclass context attributes."""
+        return {name: getattr(self, name) for name in self._detail_fields}
+    
+    def __reduce__(self):
+        # BaseException.__reduce__ only carries args and __dict__, which would
+        # drop every slot; recreate without __init__ and restore all state
+        state = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return (copyreg.__newobj__, (type(self), *self.args), state)
 
 
 class ConstitutionViolationError(TrueAssetException):
     """Raised when a Constitution rule is violated."""
     
+    __slots__ = ("rule_section", "violation_details")
+    _detail_fields = __slots__
+    
     def __init__(
         self,
         message: str,
         rule_section: str,
         violation_details: Optional[Dict[str, Any]] = None
     ):
+        self.rule_section = rule_section
+        self.violation_details = violation_details
         super().__init__(
             message=message,
             error_code="CONSTITUTION_VIOLATION",
-            status_code=400,
-            details={
-                "rule_section": rule_section,
-                "violation_details": violation_details or {}
-            }
+            status_code=400
         )
+    
+    def _build_details(self) -> Dict[str, Any]:
+        return {
+            "rule_section": self.rule_section,
+            "violation_details": self.violation_details or {}
+        }
 
 
 class RiskManagementError(TrueAssetException):
     """Raised when risk management rules are violated."""
     
+    __slots__ = ("risk_level", "current_metrics")
+    _detail_fields = __slots__
+    
     def __init__(
         self,
         message: str,
         risk_level: str,
         current_metrics: Optional[Dict[str, Any]] = None
     ):
+        self.risk_level = risk_level
+        self.current_metrics = current_metrics
         super().__init__(
             message=message,
             error_code="RISK_MANAGEMENT_ERROR",
-            status_code=400,
-            details={
-                "risk_level": risk_level,
-                "current_metrics": current_metrics or {}
-            }
+            status_code=400
         )
+    
+    def _build_details(self) -> Dict[str, Any]:
+        return {
+            "risk_level": self.risk_level,
+            "current_metrics": self.current_metrics or {}
+        }
 
 
 class AccountManagementError(TrueAssetException):
     """Raised when account management operations fail."""
     
+    __slots__ = ("account_id", "operation")
+    _detail_fields = __slots__
+    
     def __init__(
         self,
         message: str,
         account_id: Optional[str] = None,
         operation: Optional[str] = None
     ):
+        self.account_id = account_id
+        self.operation = operation
         super().__init__(
             message=message,
             error_code="ACCOUNT_MANAGEMENT_ERROR",
-            status_code=400,
-            details={
-                "account_id": account_id,
-                "operation": operation
-            }
+            status_code=400
         )
 
 
 class TradingEngineError(TrueAssetException):
     """Raised when trading engine operations fail."""
     
+    __slots__ = ("order_id", "symbol")
+    _detail_fields = __slots__
+    
     def __init__(
         self,
         message: str,
         order_id: Optional[str] = None,
         symbol: Optional[str] = None
     ):
+        self.order_id = order_id
+        self.symbol = symbol
         super().__init__(
             message=message,
             error_code="TRADING_ENGINE_ERROR",
-            status_code=400,
-            details={
-                "order_id": order_id,
-                "symbol": symbol
-            }
+            status_code=400
         )
 
 
 class BrokerIntegrationError(TrueAssetException):
     """Raised when broker integration fails."""
     
+    __slots__ = ("broker", "error_details")
+    _detail_fields = __slots__
+    
     def __init__(
         self,
         message: str,
         broker: str = "IBKR",
         error_details: Optional[Dict[str, Any]] = None
     ):
+        self.broker = broker
+        self.error_details = error_details
         super().__init__(
             message=message,
             error_code="BROKER_INTEGRATION_ERROR",
-            status_code=503,
-            details={
-                "broker": broker,
-                "error_details": error_details or {}
-            }
+            status_code=503
         )
+    
+    def _build_details(self) -> Dict[str, Any]:
+        return {
+            "broker": self.broker,
+            "error_details": self.error_details or {}
+        }
 
 
 class MarketDataError(TrueAssetException):
     """Raised when market data operations fail."""
     
+    __slots__ = ("symbol", "data_type")
+    _detail_fields = __slots__
+    
     def __init__(
         self,
         message: str,
         symbol: Optional[str] = None,
         data_type: Optional[str] = None
     ):
+        self.symbol = symbol
+        self.data_type = data_type
         super().__init__(
             message=message,
             error_code="MARKET_DATA_ERROR",
-            status_code=503,
-            details={
-                "symbol": symbol,
-                "data_type": data_type
-            }
+            status_code=503
         )
 
 
 class ProtocolEscalationError(TrueAssetException):
     """Raised when protocol escalation fails."""
     
+    __slots__ = ("current_level", "target_level", "escalation_reason")
+    _detail_fields = __slots__
+    
     def __init__(
         self,
         message: str,
@@ -155,128 +219,143 @@ class ProtocolEscalationError(TrueAssetException):
         target_level: str,
         escalation_reason: Optional[str] = None
     ):
+        self.current_level = current_level
+        self.target_level = target_level
+        self.escalation_reason = escalation_reason
         super().__init__(
             message=message,
             error_code="PROTOCOL_ESCALATION_ERROR",
-            status_code=400,
-            details={
-                "current_level": current_level,
-                "target_level": target_level,
-                "escalation_reason": escalation_reason
-            }
+            status_code=400
         )
 
 
 class StateManagementError(TrueAssetException):
     """Raised when state management operations fail."""
     
+    __slots__ = ("current_state", "target_state")
+    _detail_fields = __slots__
+    
     def __init__(
         self,
         message: str,
         current_state: Optional[str] = None,
         target_state: Optional[str] = None
     ):
+        self.current_state = current_state
+        self.target_state = target_state
         super().__init__(
             message=message,
             error_code="STATE_MANAGEMENT_ERROR",
-            status_code=400,
-            details={
-                "current_state": current_state,
-                "target_state": target_state
-            }
+            status_code=400
         )
 
 
 class ValidationError(TrueAssetException):
     """Raised when data validation fails."""
     
+    __slots__ = ("field", "value")
+    _detail_fields = __slots__
+    
     def __init__(
         self,
         message: str,
         field: Optional[str] = None,
         value: Optional[Any] = None
     ):
+        self.field = field
+        self.value = value
         super().__init__(
             message=message,
             error_code="VALIDATION_ERROR",
-            status_code=422,
-            details={
-                "field": field,
-                "value": str(value) if value is not None else None
-            }
+            status_code=422
         )
+    
+    @property
+    def value_str(self) -> Optional[str]:
+        """The rejected value as a string, converted only when asked for."""
+        return str(self.value) if self.value is not None else None
+    
+    def _build_details(self) -> Dict[str, Any]:
+        return {
+            "field": self.field,
+            "value": self.value_str
+        }
 
 
 class ConfigurationError(TrueAssetException):
     """Raised when configuration is invalid."""
     
+    __slots__ = ("config_key",)
+    _detail_fields = __slots__
+    
     def __init__(
         self,
         message: str,
         config_key: Optional[str] = None
     ):
+        self.config_key = config_key
         super().__init__(
             message=message,
             error_code="CONFIGURATION_ERROR",
-            status_code=500,
-            details={
-                "config_key": config_key
-            }
+            status_code=500
         )
 
 
 class DatabaseError(TrueAssetException):
     """Raised when database operations fail."""
     
+    __slots__ = ("operation", "table")
+    _detail_fields = __slots__
+    
     def __init__(
         self,
         message: str,
         operation: Optional[str] = None,
         table: Optional[str] = None
     ):
+        self.operation = operation
+        self.table = table
         super().__init__(
             message=message,
             error_code="DATABASE_ERROR",
-            status_code=500,
-            details={
-                "operation": operation,
-                "table": table
-            }
+            status_code=500
         )
 
 
 class AuthenticationError(TrueAssetException):
     """Raised when authentication fails."""
     
+    __slots__ = ("auth_method",)
+    _detail_fields = __slots__
+    
     def __init__(
         self,
         message: str = "Authentication failed",
         auth_method: Optional[str] = None
     ):
+        self.auth_method = auth_method
         super().__init__(
             message=message,
             error_code="AUTHENTICATION_ERROR",
-            status_code=401,
-            details={
-                "auth_method": auth_method
-            }
+            status_code=401
         )
 
 
 class AuthorizationError(TrueAssetException):
     """Raised when authorization fails."""
     
+    __slots__ = ("required_permission",)
+    _detail_fields = __slots__
+    
     def __init__(
         self,
         message: str = "Access denied",
         required_permission: Optional[str] = None
     ):
+        self.required_permission = required_permission
         super().__init__(
             message=message,
             error_code="AUTHORIZATION_ERROR",
-            status_code=403,
-            details={
-                "required_permission": required_permission
-            }
+            status_code=403
         )
 
@@ -6,15 +6,15 @@ for complex query understanding, multi-language support, and contextual
 conversation memory. Builds upon WS7 to create a killer front-end experience.
 """
 
-from typing import Dict, Any, Optional, List, Union, Tuple
+from typing import Dict, Any, Optional, List, Union, Tuple, Deque
 from datetime import datetime, timedelta
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 import logging
 import re
 import json
 import asyncio
-from collections import defaultdict
+from collections import OrderedDict, deque
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +64,14 @@ class QueryContext:
     language: Language = Language.ENGLISH
 
 
+@dataclass
+class ProcessedQuery:
+    """Normalized query text, lowercased and tokenized once per request."""
+    raw: str
+    lower: str
+    tokens: Tuple[str, ...]
+
+
 @dataclass
 class QueryIntent:
     """Parsed query intent and parameters."""
@@ -95,13 +103,31 @@ class ConversationMemory:
     """Memory of conversation context across sessions."""
     session_id: str
     user_id: str
-    conversation_history: List[Dict[str, Any]]
+    conversation_history: Deque[Dict[str, Any]]  # Bounded, oldest turns drop off
     entity_memory: Dict[str, Any]  # Remembered entities (symbols, timeframes, etc.)
     preference_memory: Dict[str, Any]  # Learned preferences
-    context_stack: List[Dict[str, Any]]  # Context for multi-turn conversations
+    context_stack: Deque[Dict[str, Any]]  # Context for multi-turn conversations
     last_updated: datetime
 
 
+# Data sources needed by each intent, and by each family of metrics
+_INTENT_DATA = {
+    "data_request": ("position_service", "performance_service"),
+    "analysis_request": ("analytics_service", "risk_service"),
+    "scenario_query": ("scenario_engine", "risk_service"),
+    "help_request": ("documentation_service",)
+}
+_GREEK_METRICS = frozenset({"delta", "gamma", "theta", "vega"})
+_PERFORMANCE_METRICS = frozenset({"pnl", "return", "sharpe"})
+_RISK_METRICS = frozenset({"var", "volatility", "beta"})
+
+# Expected response type per intent; data requests depend on the entities
+_RESPONSE_TYPES = {
+    "analysis_request": "analysis_with_chart",
+    "scenario_query": "scenario_results"
+}
+
+
 class EnhancedQueryProcessor:
     """
     Enhanced Query Processor for Complex Conversational AI.
@@ -111,10 +137,38 @@ class EnhancedQueryProcessor:
     contextual help and assistance.
     """
     
+    # Trigger words matched anywhere in the lowercased query (substring
+    # semantics, so "impact" also matches "impacted"); one scan per group
+    _CONDITIONAL_WORDS = re.compile(r"if|when|scenario|impact|compare")
+    _MATHEMATICAL_WORDS = re.compile(r"calculate|analyze|optimize|correlation")
+    _THRESHOLD_WORDS = re.compile(r"if|when|above|below")
+    
+    # Turns of conversation history kept per session
+    _MAX_CONVERSATION_HISTORY = 50
+    
+    # Query types whose responses are always regenerated
+    _UNCACHED_QUERY_TYPES = frozenset({QueryType.SCENARIO_QUERY, QueryType.HELP_REQUEST})
+    
+    # Response handler per query type, all called as (intent, entities, context);
+    # anything else is handled conversationally
+    _RESPONSE_HANDLERS = {
+        QueryType.DATA_REQUEST: "_handle_data_request",
+        QueryType.COMPLEX_ANALYSIS: "_handle_analysis_request",
+        QueryType.SCENARIO_QUERY: "_handle_scenario_query",
+        QueryType.HELP_REQUEST: "_handle_help_request"
+    }
+    
     def __init__(self, config: Dict[str, Any] = None):
         """Initialize enhanced query processor."""
         self.config = config or {}
-        self.conversation_memories: Dict[str, ConversationMemory] = {}
+        # Bounded LRU of session memories; idle sessions expire after the TTL
+        self.conversation_memories: "OrderedDict[str, ConversationMemory]" = OrderedDict()
+        self._max_sessions = self.config.get("max_sessions", 10000)
+        self._session_ttl = timedelta(seconds=self.config.get("session_ttl", 3600))
+        # LRU of (cached_at, response); entries go stale after the TTL
+        self._response_cache: "OrderedDict[Tuple, Tuple[datetime, QueryResponse]]" = OrderedDict()
+        self._response_cache_size = self.config.get("response_cache_size", 512)
+        self._response_cache_ttl = timedelta(seconds=self.config.get("response_cache_ttl", 60))
         self.entity_extractors = self._initialize_entity_extractors()
         self.intent_classifiers = self._initialize_intent_classifiers()
         self.query_templates = self._initialize_query_templates()
@@ -123,41 +177,41 @@ class EnhancedQueryProcessor:
         logger.info("Enhanced Query Processor initialized")
     
     def _initialize_entity_extractors(self) -> Dict[str, Any]:
-        """Initialize entity extraction patterns and rules."""
+        """Initialize entity extraction patterns (compiled once) and rules."""
         return {
             "symbols": {
-                "pattern": r'\b[A-Z]{1,5}\b',
+                "regex": re.compile(r'\b[A-Z]{1,5}\b', re.IGNORECASE),
                 "validation": lambda x: len(x) <= 5 and x.isalpha()
             },
             "numbers": {
-                "pattern": r'[-+]?\d*\.?\d+',
+                "regex": re.compile(r'[-+]?\d*\.?\d+', re.IGNORECASE),
                 "validation": lambda x: True
             },
             "percentages": {
-                "pattern": r'[-+]?\d*\.?\d+%',
+                "regex": re.compile(r'[-+]?\d*\.?\d+%', re.IGNORECASE),
                 "validation": lambda x: '%' in x
             },
             "timeframes": {
-                "pattern": r'\b(?:today|yesterday|week|month|year|daily|weekly|monthly|1[DWM]|[0-9]+[DWM])\b',
+                "regex": re.compile(r'\b(?:today|yesterday|week|month|year|daily|weekly|monthly|1[DWM]|[0-9]+[DWM])\b', re.IGNORECASE),
                 "validation": lambda x: True
             },
             "metrics": {
-                "pattern": r'\b(?:delta|gamma|theta|vega|pnl|return|volatility|sharpe|var|beta)\b',
+                "regex": re.compile(r'\b(?:delta|gamma|theta|vega|pnl|return|volatility|sharpe|var|beta)\b', re.IGNORECASE),
                 "validation": lambda x: True
             },
             "actions": {
-                "pattern": r'\b(?:show|display|analyze|calculate|compare|find|get|list|explain)\b',
+                "regex": re.compile(r'\b(?:show|display|analyze|calculate|compare|find|get|list|explain)\b', re.IGNORECASE),
                 "validation": lambda x: True
             },
             "conditions": {
-                "pattern": r'\b(?:if|when|where|above|below|greater|less|equal|impacted|affected)\b',
+                "regex": re.compile(r'\b(?:if|when|where|above|below|greater|less|equal|impacted|affected)\b', re.IGNORECASE),
                 "validation": lambda x: True
             }
         }
     
     def _initialize_intent_classifiers(self) -> Dict[str, Any]:
         """Initialize intent classification rules."""
-        return {
+        classifiers = {
             "data_request": {
                 "keywords": ["show", "display", "get", "list", "what", "how much"],
                 "patterns": [
@@ -204,6 +258,12 @@ class EnhancedQueryProcessor:
                 ]
             }
         }
+        
+        # Compile the patterns once rather than on every classification
+        for config in classifiers.values():
+            config["regexes"] = [re.compile(pattern) for pattern in config["patterns"]]
+        
+        return classifiers
     
     def _initialize_query_templates(self) -> Dict[str, Any]:
         """Initialize query templates for complex query handling."""
@@ -291,8 +351,13 @@ class EnhancedQueryProcessor:
             # Resolve references using conversation memory
             resolved_entities = await self._resolve_entity_references(entities, memory)
             
-            # Generate response based on intent and entities
-            response = await self._generate_response(intent, resolved_entities, context, memory)
+            # Generate response based on intent and entities, reusing the
+            # response to an equivalent earlier query when there is one
+            cache_key = self._response_cache_key(intent, resolved_entities, context)
+            response = self._get_cached_response(cache_key)
+            if response is None:
+                response = await self._generate_response(intent, resolved_entities, context, memory)
+                self._cache_response(cache_key, intent, response)
             
             # Update conversation memory
             await self._update_conversation_memory(memory, query, response, entities)
@@ -435,29 +500,27 @@ class EnhancedQueryProcessor:
     
     # Entity extraction and intent classification methods
     
-    async def _extract_entities(self, query: str) -> Dict[str, List[str]]:
+    async def _extract_entities(self, query: ProcessedQuery) -> Dict[str, List[str]]:
         """Extract entities from query using pattern matching and NLP."""
-        entities = defaultdict(list)
+        # Dicts dedup on insert while keeping first-match order, which
+        # callers rely on when they take e.g. percentages[0]
+        entities: Dict[str, Dict[str, None]] = {}
         
         for entity_type, config in self.entity_extractors.items():
-            pattern = config["pattern"]
             validation = config["validation"]
             
-            matches = re.findall(pattern, query, re.IGNORECASE)
+            matches = config["regex"].findall(query.raw)
             for match in matches:
                 if validation(match):
-                    entities[entity_type].append(match.upper() if entity_type == "symbols" else match.lower())
+                    normalized = match.upper() if entity_type == "symbols" else match.lower()
+                    entities.setdefault(entity_type, {})[normalized] = None
         
-        # Remove duplicates
-        for entity_type in entities:
-            entities[entity_type] = list(set(entities[entity_type]))
-        
-        return dict(entities)
+        return {entity_type: list(values) for entity_type, values in entities.items()}
     
-    async def _classify_intent(self, query: str, entities: Dict[str, List[str]], 
+    async def _classify_intent(self, query: ProcessedQuery, entities: Dict[str, List[str]], 
                              memory: ConversationMemory) -> QueryIntent:
         """Classify query intent using rules and context."""
-        query_lower = query.lower()
+        query_lower = query.lower
         
         # Score each intent type
         intent_scores = {}
@@ -471,8 +534,8 @@ class EnhancedQueryProcessor:
                     score += 1.0
             
             # Pattern matching
-            for pattern in config["patterns"]:
-                if re.search(pattern, query_lower):
+            for regex in config["regexes"]:
+                if regex.search(query_lower):
                     score += 2.0
             
             intent_scores[intent_type] = score
@@ -501,12 +564,13 @@ class EnhancedQueryProcessor:
             expected_response_type=self._determine_response_type(best_intent, entities)
         )
     
-    def _determine_query_complexity(self, query: str, entities: Dict[str, List[str]]) -> QueryComplexity:
+    def _determine_query_complexity(self, query: ProcessedQuery, entities: Dict[str, List[str]]) -> QueryComplexity:
         """Determine query complexity based on structure and entities."""
         complexity_score = 0
+        query_lower = query.lower
         
         # Length-based complexity
-        if len(query.split()) > 15:
+        if len(query.tokens) > 15:
             complexity_score += 1
         
         # Entity count complexity
@@ -515,11 +579,11 @@ class EnhancedQueryProcessor:
             complexity_score += 1
         
         # Conditional complexity
-        if any(word in query.lower() for word in ["if", "when", "scenario", "impact", "compare"]):
+        if self._CONDITIONAL_WORDS.search(query_lower):
             complexity_score += 2
         
         # Mathematical complexity
-        if any(word in query.lower() for word in ["calculate", "analyze", "optimize", "correlation"]):
+        if self._MATHEMATICAL_WORDS.search(query_lower):
             complexity_score += 1
         
         if complexity_score >= 4:
@@ -533,57 +597,41 @@ class EnhancedQueryProcessor:
     
     def _determine_required_data(self, intent: str, entities: Dict[str, List[str]]) -> List[str]:
         """Determine what data sources are needed for the query."""
-        data_sources = []
-        
         # Intent-based data sources
-        intent_data_map = {
-            "data_request": ["position_service", "performance_service"],
-            "analysis_request": ["analytics_service", "risk_service"],
-            "scenario_query": ["scenario_engine", "risk_service"],
-            "help_request": ["documentation_service"]
-        }
-        
-        data_sources.extend(intent_data_map.get(intent, []))
+        data_sources = set(_INTENT_DATA.get(intent, ()))
         
         # Entity-based data sources
         if "symbols" in entities:
-            data_sources.extend(["market_data", "position_service"])
+            data_sources.update(("market_data", "position_service"))
         
         if "metrics" in entities:
-            metrics = entities["metrics"]
-            if any(metric in ["delta", "gamma", "theta", "vega"] for metric in metrics):
-                data_sources.append("greeks_service")
-            if any(metric in ["pnl", "return", "sharpe"] for metric in metrics):
-                data_sources.append("performance_service")
-            if any(metric in ["var", "volatility", "beta"] for metric in metrics):
-                data_sources.append("risk_service")
+            metrics = set(entities["metrics"])
+            if not metrics.isdisjoint(_GREEK_METRICS):
+                data_sources.add("greeks_service")
+            if not metrics.isdisjoint(_PERFORMANCE_METRICS):
+                data_sources.add("performance_service")
+            if not metrics.isdisjoint(_RISK_METRICS):
+                data_sources.add("risk_service")
         
-        return list(set(data_sources))
+        return list(data_sources)
     
     def _determine_response_type(self, intent: str, entities: Dict[str, List[str]]) -> str:
         """Determine expected response type."""
         if intent == "data_request":
-            if "symbols" in entities and len(entities["symbols"]) > 1:
-                return "table"
-            else:
-                return "summary"
-        elif intent == "analysis_request":
-            return "analysis_with_chart"
-        elif intent == "scenario_query":
-            return "scenario_results"
-        else:
-            return "text_response"
+            return "table" if len(entities.get("symbols", ())) > 1 else "summary"
+        return _RESPONSE_TYPES.get(intent, "text_response")
     
-    def _extract_parameters(self, query: str, entities: Dict[str, List[str]]) -> Dict[str, Any]:
+    def _extract_parameters(self, query: ProcessedQuery, entities: Dict[str, List[str]]) -> Dict[str, Any]:
         """Extract parameters from query and entities."""
         parameters = {}
+        query_lower = query.lower
         
         # Extract comparison parameters
-        if "compare" in query.lower():
+        if "compare" in query_lower:
             parameters["comparison_type"] = "comparison"
         
         # Extract conditional parameters
-        if any(word in query.lower() for word in ["if", "when", "above", "below"]):
+        if self._THRESHOLD_WORDS.search(query_lower):
             parameters["conditional"] = True
             
             # Extract threshold values
@@ -607,17 +655,16 @@ class EnhancedQueryProcessor:
     async def _generate_response(self, intent: QueryIntent, entities: Dict[str, List[str]], 
                                context: QueryContext, memory: ConversationMemory) -> QueryResponse:
         """Generate response based on intent and entities."""
-        
-        if intent.intent_type == QueryType.DATA_REQUEST:
-            return await self._handle_data_request(intent, entities, context)
-        elif intent.intent_type == QueryType.COMPLEX_ANALYSIS:
-            return await self._handle_analysis_request(intent, entities, context)
-        elif intent.intent_type == QueryType.SCENARIO_QUERY:
-            return await self._handle_scenario_query(intent, entities, context)
-        elif intent.intent_type == QueryType.HELP_REQUEST:
-            return await self.provide_contextual_help(context)
-        else:
+        handler_name = self._RESPONSE_HANDLERS.get(intent.intent_type)
+        if handler_name is None:
             return await self._handle_conversational_query(intent, entities, context, memory)
+        
+        return await getattr(self, handler_name)(intent, entities, context)
+    
+    async def _handle_help_request(self, intent: QueryIntent, entities: Dict[str, List[str]], 
+                                 context: QueryContext) -> QueryResponse:
+        """Handle help requests with contextual help for the session."""
+        return await self.provide_contextual_help(context)
     
     async def _handle_data_request(self, intent: QueryIntent, entities: Dict[str, List[str]], 
                                  context: QueryContext) -> QueryResponse:
@@ -735,22 +782,85 @@ class EnhancedQueryProcessor:
             processing_time=0.0
         )
     
+    # Response caching
+    
+    def _response_cache_key(self, intent: QueryIntent, entities: Dict[str, List[str]],
+                            context: QueryContext) -> Tuple:
+        """Build a cache key from the user, session, normalized intent, entities and language."""
+        # Handlers answer from the caller's own portfolio and session, so
+        # responses are never shared across users or sessions
+        return (
+            context.user_id,
+            context.session_id,
+            intent.intent_type.value,
+            tuple(sorted((entity_type, tuple(sorted(values))) for entity_type, values in entities.items())),
+            tuple(sorted(intent.parameters.items())),
+            context.language.value
+        )
+    
+    def _get_cached_response(self, key: Tuple) -> Optional[QueryResponse]:
+        """Return a copy of a cached response, or None on a miss."""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        
+        cached_at, cached = entry
+        if datetime.utcnow() - cached_at > self._response_cache_ttl:
+            del self._response_cache[key]
+            return None
+        
+        self._response_cache.move_to_end(key)
+        # Callers annotate response.data, so never hand out the cached dict
+        return replace(cached, data=dict(cached.data))
+    
+    def _cache_response(self, key: Tuple, intent: QueryIntent, response: QueryResponse):
+        """Cache a generated response, evicting the least recently used."""
+        # Scenario results depend on volatile market context, help depends on
+        # session memory, and failed or clarifying responses should be retried
+        # rather than replayed
+        if intent.intent_type in self._UNCACHED_QUERY_TYPES or response.requires_clarification:
+            return
+        
+        self._response_cache[key] = (datetime.utcnow(), replace(response, data=dict(response.data)))
+        if len(self._response_cache) > self._response_cache_size:
+            self._response_cache.popitem(last=False)
+    
     # Memory and context management
     
     async def _get_conversation_memory(self, session_id: str, user_id: str) -> ConversationMemory:
         """Get or create conversation memory."""
-        if session_id not in self.conversation_memories:
-            self.conversation_memories[session_id] = ConversationMemory(
+        now = datetime.utcnow()
+        memory = self.conversation_memories.get(session_id)
+        
+        if memory is not None and now - memory.last_updated > self._session_ttl:
+            del self.conversation_memories[session_id]
+            memory = None
+        
+        if memory is None:
+            self._evict_conversation_memories(now)
+            memory = ConversationMemory(
                 session_id=session_id,
                 user_id=user_id,
-                conversation_history=[],
+                conversation_history=deque(maxlen=self._MAX_CONVERSATION_HISTORY),
                 entity_memory={},
                 preference_memory={},
-                context_stack=[],
-                last_updated=datetime.utcnow()
+                context_stack=deque(maxlen=self._MAX_CONVERSATION_HISTORY),
+                last_updated=now
             )
+            self.conversation_memories[session_id] = memory
+        else:
+            self.conversation_memories.move_to_end(session_id)
         
-        return self.conversation_memories[session_id]
+        return memory
+    
+    def _evict_conversation_memories(self, now: datetime):
+        """Make room for a new session by dropping expired and least recently used ones."""
+        memories = self.conversation_memories
+        while memories:
+            oldest = next(iter(memories.values()))
+            if len(memories) < self._max_sessions and now - oldest.last_updated <= self._session_ttl:
+                break
+            memories.popitem(last=False)
     
     async def _resolve_entity_references(self, entities: Dict[str, List[str]], 
                                        memory: ConversationMemory) -> Dict[str, List[str]]:
@@ -784,10 +894,6 @@ class EnhancedQueryProcessor:
         if entities.get("timeframes"):
             memory.entity_memory["last_timeframe"] = entities["timeframes"][0]
         
-        # Limit conversation history size
-        if len(memory.conversation_history) > 50:
-            memory.conversation_history = memory.conversation_history[-50:]
-        
         memory.last_updated = datetime.utcnow()
     
     # Language support methods
@@ -812,7 +918,7 @@ class EnhancedQueryProcessor:
     
     # Helper methods
     
-    async def _preprocess_query(self, query: str, language: Language) -> str:
+    async def _preprocess_query(self, query: str, language: Language) -> ProcessedQuery:
         """Preprocess query for better understanding."""
         # Remove extra whitespace
         query = re.sub(r'\s+', ' ', query.strip())
@@ -830,7 +936,8 @@ class EnhancedQueryProcessor:
         for contraction, expansion in contractions.items():
             query = query.replace(contraction, expansion)
         
-        return query
+        query_lower = query.lower()
+        return ProcessedQuery(raw=query, lower=query_lower, tokens=tuple(query_lower.split()))
     
     def _generate_error_response_obj(self, error_message: str) -> QueryResponse:
         """Generate error response object."""
@@ -867,7 +974,10 @@ class EnhancedQueryProcessor:
     
     def get_conversation_memory_dict(self, memory: ConversationMemory) -> Dict[str, Any]:
         """Convert conversation memory to dictionary."""
-        return asdict(memory)
+        memory_dict = asdict(memory)
+        memory_dict["conversation_history"] = list(memory_dict["conversation_history"])
+        memory_dict["context_stack"] = list(memory_dict["context_stack"])
+        return memory_dict
     
     def get_supported_languages(self) -> List[str]:
         """Get list of supported languages."""
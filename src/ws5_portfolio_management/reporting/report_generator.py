@@ -26,6 +26,12 @@ getcontext().prec = 10
 logger = logging.getLogger(__name__)
 
 
+def _html_list_section(title: str, data: Dict[str, Any]) -> str:
+    """Render a titled HTML list of the key/value pairs in data."""
+    items = "".join(f"<li><b>{key}:</b> {value}</li>" for key, value in data.items())
+    return f"<h2>{title}</h2><ul>{items}</ul>"
+
+
 class ReportFormat(Enum):
     """Report output formats."""
     PDF = "pdf"
@@ -228,20 +234,23 @@ class ReportGenerator:
                               report_def: ReportDefinition,
                               report_data: Dict[str, Any]) -> str:
         """Generate HTML report."""
-        html = f"<html><head><title>{report_def.name}</title></head><body>"
-        html += f"<h1>{report_def.name}</h1>"
-        html += f"<h2>Portfolio: {report_def.portfolio_id}</h2>"
-        html += f"<h3>Period: {report_def.start_date} to {report_def.end_date}</h3>"
+        parts = [
+            f"<html><head><title>{report_def.name}</title></head><body>",
+            f"<h1>{report_def.name}</h1>",
+            f"<h2>Portfolio: {report_def.portfolio_id}</h2>",
+            f"<h3>Period: {report_def.start_date} to {report_def.end_date}</h3>",
+        ]
         
         # Report sections
         for section in report_def.sections:
             if section == ReportSection.SUMMARY:
-                html += self._add_summary_section_html(report_data.get("summary"))
+                parts.append(self._add_summary_section_html(report_data.get("summary")))
             elif section == ReportSection.PERFORMANCE:
-                html += self._add_performance_section_html(report_data.get("performance"))
+                parts.append(self._add_performance_section_html(report_data.get("performance")))
             # Add other sections...
             
-        html += "</body></html>"
+        parts.append("</body></html>")
+        html = "".join(parts)
         
         file_path = f"{self.report_output_dir}/{report_def.report_id}.html"
         with open(file_path, "w") as f:
@@ -267,20 +276,10 @@ class ReportGenerator:
         pdf.ln(10)
     
     def _add_summary_section_html(self, data: Dict[str, Any]) -> str:
-        html = "<h2>Portfolio Summary</h2>"
-        html += "<ul>"
-        for key, value in data.items():
-            html += f"<li><b>{key}:</b> {value}</li>"
-        html += "</ul>"
-        return html
+        return _html_list_section("Portfolio Summary", data)
     
     def _add_performance_section_html(self, data: Dict[str, Any]) -> str:
-        html = "<h2>Performance Analysis</h2>"
-        html += "<ul>"
-        for key, value in data.items():
-            html += f"<li><b>{key}:</b> {value}</li>"
-        html += "</ul>"
-        return html
+        return _html_list_section("Performance Analysis", data)
     
     def get_generator_status(self) -> Dict[str, Any]:
         """Get report generator status."""
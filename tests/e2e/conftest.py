@@ -0,0 +1,143 @@
+"""
+Pytest fixtures for True-Asset-ALLUSE end-to-end tests.
+
+The full system is started once per session and shared by every E2E test.
+"""
+
+import asyncio
+import atexit
+import hashlib
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+# A conftest import error aborts the whole pytest session, so a system that
+# cannot be imported only skips the E2E tests that need it
+try:
+    from integration.system_orchestrator.main_application import TrueAssetAllUseSystem
+    from integration.testing_framework.test_suite import E2ETestSuite
+except ImportError as exc:
+    TrueAssetAllUseSystem = E2ETestSuite = None
+    SYSTEM_IMPORT_ERROR = exc
+else:
+    SYSTEM_IMPORT_ERROR = None
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Sources whose configuration the GPT-5 corrections validation reads
+GPT5_SOURCES = (
+    "src/ws2_protocol_engine/atr/atr_engine.py",
+    "src/ws2_protocol_engine/escalation/escalation_manager.py",
+    "src/ws2_protocol_engine/roll_economics/roll_cost_threshold.py",
+    "src/ws4_market_data_execution/execution_engine/liquidity_validator.py",
+    "src/ws1_rules_engine/constitution/llms_specifications.py",
+    "src/ws1_rules_engine/constitution/assignment_protocol.py",
+    "src/ws1_rules_engine/constitution/week_classification.py",
+    "src/ws3_account_management/state_machine/safe_active_reconciliation.py",
+    "src/ws1_rules_engine/constitution/earnings_filter.py",
+    "src/ws2_protocol_engine/escalation/hedge_deployment.py",
+    "integration/testing_framework/test_suite.py",
+)
+
+
+def _stop_system_at_exit(system: "TrueAssetAllUseSystem") -> None:
+    """Stop a system that outlived its fixture (e.g. an xdist worker killed mid-session)."""
+    if system.is_running:
+        asyncio.run(system.stop_system())
+
+
+@pytest_asyncio.fixture(scope="session")
+async def system():
+    """Start the True-Asset-ALLUSE system and stop it even if tests fail."""
+    if SYSTEM_IMPORT_ERROR is not None:
+        pytest.skip(f"True-Asset-ALLUSE system cannot be imported: {SYSTEM_IMPORT_ERROR}")
+    
+    system = TrueAssetAllUseSystem()
+    await system.start_system()
+    atexit.register(_stop_system_at_exit, system)
+    
+    try:
+        yield system
+    finally:
+        await system.stop_system()
+        atexit.unregister(_stop_system_at_exit)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def e2e_suite(system):
+    """E2E suite bound to the shared system, used to run its helpers once."""
+    suite = E2ETestSuite()
+    suite.system = system
+    return suite
+
+
+@pytest.fixture(scope="session")
+def gpt5_cache(request):
+    """pytest's cross-session cache (None when the cacheprovider plugin is disabled)."""
+    return getattr(request.config, "cache", None)
+
+
+@pytest.fixture(scope="session")
+def gpt5_cache_key():
+    """Cache key derived from the contents of the GPT-5 validated sources."""
+    digest = hashlib.blake2b(digest_size=16)
+    for relative_path in GPT5_SOURCES:
+        digest.update(relative_path.encode())
+        digest.update((PROJECT_ROOT / relative_path).read_bytes())
+    return f"gpt5/{digest.hexdigest()}"
+
+
+# Integration and performance runs are expensive, so each one executes once
+# per session and several tests assert different invariants on its result.
+
+@pytest_asyncio.fixture(scope="session")
+async def workflow_result(e2e_suite):
+    """Result of a complete end-to-end workflow."""
+    return await e2e_suite._execute_complete_workflow()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def communication_result(e2e_suite):
+    """Result of the cross-workstream communication check."""
+    return await e2e_suite._test_workstream_communication()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def stress_result(e2e_suite):
+    """Result of running the system under stress."""
+    return await e2e_suite._test_system_under_stress()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def consistency_result(e2e_suite):
+    """Result of the cross-workstream data consistency sweep."""
+    return await e2e_suite._check_data_consistency()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def concurrency_result(e2e_suite):
+    """Result of the concurrent operations run."""
+    return await e2e_suite._test_concurrent_operations_internal()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def performance_metrics(e2e_suite):
+    """Throughput (ops/s), response time (s) and memory usage (MB)."""
+    return {
+        "throughput": await e2e_suite._measure_system_throughput(),
+        "response_time": await e2e_suite._measure_response_times(),
+        "memory_usage": await e2e_suite._measure_memory_usage(),
+    }
+
+
+@pytest_asyncio.fixture(scope="session")
+async def scalability_result(e2e_suite):
+    """Result of the scalability run."""
+    return await e2e_suite._test_system_scalability()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def load_result(e2e_suite):
+    """Result of the load handling run."""
+    return await e2e_suite._test_system_load_handling()
@@ -0,0 +1,88 @@
+"""
+End-to-end tests for the True-Asset-ALLUSE system.
+
+Runs against the session-scoped ``system`` fixture from ``conftest.py``.
+"""
+
+from datetime import datetime
+
+import pytest
+
+pytestmark = pytest.mark.e2e
+
+# Every test here drives the live system (directly or through the session
+# result fixtures), so none of them can run while it fails to import
+try:
+    from integration.testing_framework.test_suite import WS_CASES
+except ImportError as exc:
+    pytest.skip(f"True-Asset-ALLUSE system cannot be imported: {exc}", allow_module_level=True)
+
+
+@pytest.mark.asyncio
+async def test_system_running(system):
+    """The shared system is started before any E2E test runs."""
+    status = system.get_system_status()
+    assert status["is_running"] is True
+    assert status["system_state"] == "RUNNING"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "group,name,call,check",
+    WS_CASES,
+    ids=[f"{group}-{name}" for group, name, _, _ in WS_CASES],
+)
+async def test_workstream(system, group, name, call, check):
+    """Each workstream case's call against the shared system satisfies its check."""
+    assert check(await call(system))
+
+
+class TestIntegration:
+    """System integration invariants over shared session results."""
+    
+    def test_end_to_end_workflow(self, workflow_result):
+        assert workflow_result["success"] is True
+    
+    def test_cross_workstream_communication(self, communication_result):
+        assert communication_result["all_connected"] is True
+    
+    def test_system_resilience(self, stress_result):
+        assert stress_result["system_stable"] is True
+    
+    def test_data_consistency(self, consistency_result):
+        assert consistency_result["consistent"] is True
+    
+    def test_concurrent_operations(self, concurrency_result):
+        assert concurrency_result["success"] is True
+
+
+class TestPerformance:
+    """System performance invariants over shared session results."""
+    
+    def test_system_throughput(self, performance_metrics):
+        assert performance_metrics["throughput"] > 100  # Minimum 100 operations per second
+    
+    def test_response_times(self, performance_metrics):
+        assert performance_metrics["response_time"] < 1.0  # Maximum 1 second response time
+    
+    def test_memory_usage(self, performance_metrics):
+        assert performance_metrics["memory_usage"] < 1000  # Maximum 1GB memory usage
+    
+    def test_scalability(self, scalability_result):
+        assert scalability_result["scalable"] is True
+    
+    def test_load_handling(self, load_result):
+        assert load_result["handles_load"] is True
+
+
+@pytest.mark.asyncio
+async def test_gpt5_corrections(e2e_suite, gpt5_cache, gpt5_cache_key):
+    """GPT-5 corrections hold; skipped while the validated sources are unchanged since a pass."""
+    if gpt5_cache is not None and gpt5_cache.get(gpt5_cache_key, None):
+        pytest.skip("GPT-5 corrections unchanged since last passing validation")
+    
+    results = await e2e_suite.validate_gpt5_corrections()
+    assert results["overall_success"] is True, results["validations"]
+    
+    if gpt5_cache is not None:
+        gpt5_cache.set(gpt5_cache_key, {"passed": True, "ts": datetime.utcnow().isoformat()})
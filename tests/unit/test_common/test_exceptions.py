@@ -0,0 +1,60 @@
+"""
+Tests for the custom exception hierarchy
+
+Ensures exception context survives pickling and copying, as happens when
+errors cross process boundaries (e.g. Celery task results).
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from src.common.exceptions import (
+    TrueAssetException,
+    ConstitutionViolationError,
+    AccountManagementError,
+    BrokerIntegrationError,
+    ValidationError,
+    AuthenticationError,
+)
+
+
+EXCEPTIONS = [
+    TrueAssetException("Base failure", "BASE_ERROR", 418, {"key": "value"}),
+    ConstitutionViolationError("Rule broken", "2.1", {"limit": 0.25}),
+    AccountManagementError("Account failure", account_id="A1", operation="fork"),
+    BrokerIntegrationError("Broker down", broker="IBKR"),
+    ValidationError("Bad value", field="quantity", value=-5),
+    AuthenticationError(auth_method="token"),
+]
+
+
+def _round_trips(exc):
+    yield pickle.loads(pickle.dumps(exc))
+    yield pickle.loads(pickle.dumps(exc, protocol=0))
+    yield copy.copy(exc)
+    yield copy.deepcopy(exc)
+
+
+class TestExceptionSerialization:
+    """Test that exception state is preserved across pickle and copy."""
+
+    @pytest.mark.parametrize("exc", EXCEPTIONS, ids=lambda exc: type(exc).__name__)
+    def test_round_trip_preserves_state(self, exc):
+        """Test message, codes, context attributes and details round-trip."""
+        for restored in _round_trips(exc):
+            assert type(restored) is type(exc)
+            assert restored.args == exc.args
+            assert restored.message == exc.message
+            assert restored.error_code == exc.error_code
+            assert restored.status_code == exc.status_code
+            assert restored.details == exc.details
+            for name in exc._detail_fields:
+                assert getattr(restored, name) == getattr(exc, name)
+
+    def test_round_trip_before_details_are_built(self):
+        """Test details are still built correctly after an unread round-trip."""
+        restored = pickle.loads(pickle.dumps(AccountManagementError("Failure", account_id="A1")))
+
+        assert restored.details == {"account_id": "A1", "operation": None}